@@ -0,0 +1,83 @@
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from common import loadModule
+
+deletionEngine = loadModule("deletionEngine")
+targetRules = loadModule("targetRules")
+
+CACHE_DIRS = (
+    os.path.join("Cache", "Cache_Data"),
+    os.path.join("Code Cache", "js"),
+    os.path.join("Code Cache", "wasm"),
+    "GPUCache",
+    os.path.join("Service Worker", "CacheStorage", "0a1b2c"),
+)
+
+
+def getFileCounts(layout, filesPerDir):
+    if layout == "dominant":
+        others = len(CACHE_DIRS) - 1
+        return [filesPerDir * len(CACHE_DIRS) - others] + [1] * others
+    return [filesPerDir] * len(CACHE_DIRS)
+
+
+def buildProfile(root, profiles, filesPerDir, layout):
+    payload = b"x" * 512
+    profile_paths = []
+    for index in range(profiles):
+        profile = os.path.join(root, "Default" if index == 0 else "Profile {}".format(index))
+        profile_paths.append(profile)
+        for relative, count in zip(CACHE_DIRS, getFileCounts(layout, filesPerDir)):
+            directory = os.path.join(profile, relative)
+            os.makedirs(directory)
+            for number in range(count):
+                with open(os.path.join(directory, "f_{:06x}".format(number)), "wb") as f:
+                    f.write(payload)
+        for name in ("History", "Cookies", "Favicons", "Top Sites", "Preferences"):
+            with open(os.path.join(profile, name), "wb") as f:
+                f.write(payload)
+    return profile_paths
+
+
+def timeRun(workers, profiles, filesPerDir, layout):
+    root = tempfile.mkdtemp(prefix="bhr_delete_")
+    try:
+        profile_paths = buildProfile(root, profiles, filesPerDir, layout)
+        engine = deletionEngine.DeletionEngine(workers=workers)
+        start = time.perf_counter()
+        counts = engine.removeTargets(targetRules.getTargetRules("Google Chrome").scanPaths(profile_paths))
+        return time.perf_counter() - start, counts
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serial vs parallel cache deletion")
+    parser.add_argument("--profiles", type=int, default=3)
+    parser.add_argument("--files", type=int, default=4000, help="files per cache directory")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument(
+        "--layouts", nargs="+", choices=["spread", "dominant"], default=["spread", "dominant"],
+        help="spread: the same number of files in every cache folder; dominant: almost all files in Cache/Cache_Data"
+    )
+    args = parser.parse_args()
+
+    total = args.profiles * len(CACHE_DIRS) * args.files
+    print("cache files: {}".format(total))
+    for layout in args.layouts:
+        baseline = None
+        for workers in args.workers:
+            elapsed, counts = timeRun(workers, args.profiles, args.files, layout)
+            if baseline is None:
+                baseline = elapsed
+            print("layout={:<9} workers={:<3} {:.3f}s  {:.0f} files/s  speedup {:.2f}x  counts={}".format(
+                layout, workers, elapsed, total / elapsed, baseline / elapsed, counts
+            ))
+
+
+if __name__ == "__main__":
+    main()
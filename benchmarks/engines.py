@@ -0,0 +1,204 @@
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from nvdaStubs import loadAddon
+import fixtures
+
+FORMATS = ("deduplicated", "folder", "archive")
+BROWSERS = tuple(fixtures.BUILDERS)
+
+
+class CountingProgress:
+    def __init__(self, engine):
+        self.progress = engine.JobProgress()
+        self.files = 0
+        self.bytes = 0
+
+    def __getattr__(self, name):
+        return getattr(self.progress, name)
+
+    def setPhase(self, phase):
+        self.progress.setPhase(phase)
+
+    def advance(self, files=1, bytes=0):
+        self.files += files
+        self.bytes += bytes
+        self.progress.advance(files, bytes)
+
+
+def measure(function, traceMemory):
+    if traceMemory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        result = function()
+    finally:
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if traceMemory else None
+        if traceMemory:
+            tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def record(results, browser, operation, variant, elapsed, peak, files, size, result):
+    entry = {
+        "browser": browser,
+        "operation": operation,
+        "variant": variant,
+        "seconds": round(elapsed, 6),
+        "files": files,
+        "bytes": size,
+        "filesPerSecond": round(files / elapsed, 1) if elapsed and files else None,
+        "mbPerSecond": round(size / elapsed / (1024 * 1024), 2) if elapsed and size else None,
+        "peakMemoryKb": round(peak / 1024, 1) if peak is not None else None,
+        "ok": bool(result[0]) if isinstance(result, tuple) else True,
+    }
+    results.append(entry)
+    print("{browser:<14} {operation:<10} {variant:<13} {seconds:>8.3f}s {files:>8} files {rate:>10} files/s {mb:>8} MB/s  peak {peak} KB{status}".format(
+        rate=entry["filesPerSecond"] or "-",
+        mb=entry["mbPerSecond"] or "-",
+        peak=entry["peakMemoryKb"] if peak is not None else "-",
+        status="" if entry["ok"] else "  FAILED: {}".format(result[1]),
+        **entry
+    ))
+    return entry
+
+
+def buildTree(home, browser, spec):
+    shutil.rmtree(home, ignore_errors=True)
+    fixtures.BUILDERS[browser](home, spec)
+
+
+def benchBrowser(engine, home, browser, spec, formats, traceMemory, results):
+    conf = sys.modules["config"].conf["browserHistoryRemover"]
+    browser_path = engine.getBrowserPath(browser)
+
+    for backup_format in formats:
+        buildTree(home, browser, spec)
+        conf["backupFormat"] = backup_format
+        progress = CountingProgress(engine)
+        elapsed, peak, result = measure(lambda: engine.copyHistoryFiles(browser_path, browser, progress), traceMemory)
+        record(results, browser, "copy", backup_format, elapsed, peak, progress.files, progress.bytes, result)
+        if not result[0]:
+            continue
+        backup_path = result[1]
+        elapsed, peak, result = measure(
+            lambda: engine.restoreHistoryFiles(backup_path, browser_path, browser, CountingProgress(engine)),
+            traceMemory
+        )
+        record(results, browser, "restore", backup_format, elapsed, peak, progress.files, progress.bytes, result)
+
+    for deferred in (False, True):
+        buildTree(home, browser, spec)
+        plan = engine.buildPlan(browser_path, browser, engine.JobProgress())
+        elapsed, peak, result = measure(
+            lambda: engine.deleteHistoryFiles(browser_path, browser, deferred=deferred, progress=CountingProgress(engine)),
+            traceMemory
+        )
+        record(results, browser, "delete", "trash" if deferred else "direct", elapsed, peak, plan.files, plan.bytes, result)
+
+    for range_key in ("day", "all"):
+        buildTree(home, browser, spec)
+        plan = engine.buildPlan(browser_path, browser, engine.JobProgress())
+        databases = [entry.path for entry, category in plan.targets if engine.classifyDatabase(entry.name)]
+        size = sum(os.path.getsize(path) for path in databases)
+        elapsed, peak, result = measure(
+            lambda: engine.purgeHistoryDatabases(browser_path, browser, range_key, CountingProgress(engine)),
+            traceMemory
+        )
+        record(results, browser, "purge", range_key, elapsed, peak, len(databases), size, result)
+
+
+def benchProcessCheck(engine, calls, traceMemory, results):
+    def run():
+        for index in range(calls):
+            engine.processIndex.invalidate()
+            engine.isBrowserRunning("Google Chrome")
+        return True, ""
+
+    elapsed, peak, result = measure(run, traceMemory)
+    entry = record(results, "-", "isRunning", "cold x{}".format(calls), elapsed, peak, 0, 0, result)
+    entry["callsPerSecond"] = round(calls / elapsed, 1)
+    print("{:>48} calls/s".format(entry["callsPerSecond"]))
+
+    def runCached():
+        for index in range(calls):
+            engine.isBrowserRunning("Google Chrome")
+        return True, ""
+
+    elapsed, peak, result = measure(runCached, traceMemory)
+    entry = record(results, "-", "isRunning", "cached x{}".format(calls), elapsed, peak, 0, 0, result)
+    entry["callsPerSecond"] = round(calls / elapsed, 1)
+    print("{:>48} calls/s".format(entry["callsPerSecond"]))
+
+
+def compare(results, previous_path):
+    with open(previous_path, "r", encoding="utf-8") as f:
+        previous = dict(
+            ((entry["browser"], entry["operation"], entry["variant"]), entry) for entry in json.load(f)["results"]
+        )
+    print("\nCompared with {}:".format(previous_path))
+    for entry in results:
+        old = previous.get((entry["browser"], entry["operation"], entry["variant"]))
+        if old and old["seconds"]:
+            print("{:<14} {:<10} {:<13} {:>7.2f}x".format(
+                entry["browser"], entry["operation"], entry["variant"], old["seconds"] / entry["seconds"]
+            ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the add-on's file engines against synthetic browser profiles")
+    parser.add_argument("--browsers", nargs="+", choices=BROWSERS, default=list(BROWSERS))
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=list(FORMATS))
+    parser.add_argument("--profiles", type=int, default=2)
+    parser.add_argument("--cache-files", type=int, default=2000, help="cache files per profile")
+    parser.add_argument("--cache-file-size", type=int, default=8192)
+    parser.add_argument("--history-rows", type=int, default=20000, help="visits per history database")
+    parser.add_argument("--process-calls", type=int, default=20)
+    parser.add_argument("--no-memory", action="store_true", help="skip tracemalloc, which slows allocation-heavy code")
+    parser.add_argument("--json", help="write machine-readable results to this file")
+    parser.add_argument("--compare", help="earlier --json output to compare against")
+    args = parser.parse_args()
+
+    work = tempfile.mkdtemp(prefix="bhr_bench_")
+    home = os.path.join(work, "home")
+    os.environ["HOME"] = home
+    os.environ["USERPROFILE"] = home
+    engine = loadAddon(os.path.join(work, "nvda"))
+    spec = fixtures.ProfileSpec(
+        profiles=args.profiles,
+        cacheFiles=args.cache_files,
+        cacheFileSize=args.cache_file_size,
+        historyRows=args.history_rows,
+    )
+    results = []
+    try:
+        for browser in args.browsers:
+            benchBrowser(engine, home, browser, spec, args.formats, not args.no_memory, results)
+        benchProcessCheck(engine, args.process_calls, not args.no_memory, results)
+    finally:
+        engine.reaper.stop()
+        shutil.rmtree(work, ignore_errors=True)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": dict(spec.asDict(), formats=args.formats, browsers=args.browsers),
+        "results": results,
+    }
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
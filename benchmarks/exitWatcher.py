@@ -0,0 +1,76 @@
+import argparse
+import importlib
+import subprocess
+import sys
+import threading
+import time
+
+from nvdaStubs import ADDON_PACKAGE, REPO_DIR
+
+sys.path.insert(0, REPO_DIR)
+exitWatcher = importlib.import_module(ADDON_PACKAGE + ".exitWatcher")
+
+
+BROWSER = """
+import subprocess, sys, time
+helpers = [subprocess.Popen([sys.executable, "-c", "import time; time.sleep({seconds})"]) for i in range({helpers})]
+print("ready", flush=True)
+time.sleep({seconds})
+for helper in helpers:
+    helper.wait()
+"""
+
+
+class SpawnedWatcher(exitWatcher.ExitWatcher):
+    def __init__(self, browser, onExit, debounce, rootsOnly):
+        super().__init__(onExit, debounce=debounce)
+        self.browserProcess = browser
+        self.rootsOnly = rootsOnly
+
+    def findProcesses(self, browser):
+        try:
+            root = exitWatcher.psutil.Process(self.browserProcess.pid)
+            procs = [root] + root.children(recursive=True)
+        except exitWatcher.psutil.NoSuchProcess:
+            return []
+        if self.rootsOnly:
+            return exitWatcher.findRootProcesses(procs)
+        return procs
+
+
+def measure(processes, seconds, debounce, rootsOnly):
+    browser = subprocess.Popen(
+        [sys.executable, "-c", BROWSER.format(seconds=seconds, helpers=processes - 1)],
+        stdout=subprocess.PIPE
+    )
+    browser.stdout.readline()
+    exited = threading.Event()
+    watcher = SpawnedWatcher(browser, lambda name: exited.set(), debounce, rootsOnly)
+    cpuStart = time.process_time()
+    wallStart = time.perf_counter()
+    watcher.arm("benchmark")
+    browser.wait()
+    lastExit = time.perf_counter()
+    exited.wait()
+    wall = time.perf_counter() - wallStart
+    cpu = time.process_time() - cpuStart
+    return cpu, wall, time.perf_counter() - lastExit - debounce
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Idle CPU cost and exit detection latency of the browser exit watcher")
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 10, 30], help="browser processes to wait on")
+    parser.add_argument("--seconds", type=float, default=10.0, help="how long the processes keep running")
+    parser.add_argument("--debounce", type=float, default=0.5)
+    args = parser.parse_args()
+
+    for processes in args.processes:
+        for rootsOnly in (False, True):
+            cpu, wall, latency = measure(processes, args.seconds, args.debounce, rootsOnly)
+            print("processes={:<4} {:<5} cpu {:.4f}s over {:.1f}s ({:.3f}%)  detected {:.3f}s after exit".format(
+                processes, "roots" if rootsOnly else "all", cpu, wall, 100.0 * cpu / wall, latency
+            ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+import json
+import os
+import random
+import sqlite3
+import time
+
+from common import loadModule
+
+sqlitePurge = loadModule("sqlitePurge")
+
+DAY = 24 * 60 * 60
+HISTORY_SPAN = 30 * DAY
+
+CHROMIUM_HISTORY_SCHEMA = (
+    "CREATE TABLE urls (id INTEGER PRIMARY KEY, url TEXT, title TEXT, visit_count INTEGER, last_visit_time INTEGER)",
+    "CREATE TABLE visits (id INTEGER PRIMARY KEY, url INTEGER, visit_time INTEGER)",
+    "CREATE TABLE visit_source (id INTEGER PRIMARY KEY, source INTEGER)",
+    "CREATE TABLE keyword_search_terms (keyword_id INTEGER, url_id INTEGER, term TEXT)",
+    "CREATE TABLE segment_usage (id INTEGER PRIMARY KEY, segment_id INTEGER, time_slot INTEGER, visit_count INTEGER)",
+    "CREATE TABLE downloads (id INTEGER PRIMARY KEY, start_time INTEGER, target_path TEXT)",
+    "CREATE TABLE downloads_url_chains (id INTEGER, chain_index INTEGER, url TEXT)",
+)
+
+CHROMIUM_COOKIES_SCHEMA = (
+    "CREATE TABLE cookies (creation_utc INTEGER, host_key TEXT, name TEXT, value TEXT)",
+)
+
+FIREFOX_PLACES_SCHEMA = (
+    "CREATE TABLE moz_origins (id INTEGER PRIMARY KEY, host TEXT)",
+    "CREATE TABLE moz_places (id INTEGER PRIMARY KEY, url TEXT, title TEXT, visit_count INTEGER, last_visit_date INTEGER, foreign_count INTEGER DEFAULT 0, origin_id INTEGER)",
+    "CREATE TABLE moz_historyvisits (id INTEGER PRIMARY KEY, place_id INTEGER, visit_date INTEGER)",
+    "CREATE TABLE moz_inputhistory (place_id INTEGER, input TEXT)",
+)
+
+FIREFOX_COOKIES_SCHEMA = (
+    "CREATE TABLE moz_cookies (id INTEGER PRIMARY KEY, name TEXT, creationTime INTEGER)",
+)
+
+
+class ProfileSpec:
+    def __init__(self, profiles=2, cacheFiles=2000, cacheFileSize=8192, historyRows=20000, seed=42):
+        self.profiles = profiles
+        self.cacheFiles = cacheFiles
+        self.cacheFileSize = cacheFileSize
+        self.historyRows = historyRows
+        self.seed = seed
+
+    def asDict(self):
+        return dict(self.__dict__)
+
+
+def writeFile(path, size):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(os.urandom(size))
+
+
+def writeFiles(directory, count, size):
+    os.makedirs(directory, exist_ok=True)
+    payload = os.urandom(size)
+    for number in range(count):
+        with open(os.path.join(directory, "f_{:06x}".format(number)), "wb") as f:
+            f.write(payload)
+
+
+def _timestamps(rng, count, now):
+    return [now - rng.random() * HISTORY_SPAN for i in range(count)]
+
+
+def _createDatabase(path, schema, wal=False):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    connection = sqlite3.connect(path)
+    if wal:
+        connection.execute("PRAGMA journal_mode=WAL").fetchall()
+    for statement in schema:
+        connection.execute(statement)
+    return connection
+
+
+def buildChromiumHistory(path, rows, rng, now=None):
+    now = time.time() if now is None else now
+    toTime = sqlitePurge.webkitTime
+    connection = _createDatabase(path, CHROMIUM_HISTORY_SCHEMA)
+    with connection:
+        urls = rows // 4 or 1
+        times = _timestamps(rng, rows, now)
+        url_times = {}
+        visits = []
+        for index, visit_time in enumerate(times):
+            url_id = rng.randrange(1, urls + 1)
+            url_times[url_id] = max(url_times.get(url_id, 0), visit_time)
+            visits.append((index + 1, url_id, toTime(visit_time)))
+        connection.executemany("INSERT INTO visits VALUES (?, ?, ?)", visits)
+        connection.executemany("INSERT INTO visit_source VALUES (?, 1)", [(visit[0],) for visit in visits[::10]])
+        connection.executemany(
+            "INSERT INTO urls VALUES (?, ?, ?, 0, ?)",
+            [(url_id, "https://example{}.test/".format(url_id), "Page {}".format(url_id), toTime(visit_time))
+                for url_id, visit_time in url_times.items()]
+        )
+        connection.executemany(
+            "INSERT INTO keyword_search_terms VALUES (1, ?, ?)",
+            [(url_id, "term {}".format(url_id)) for url_id in list(url_times)[::20]]
+        )
+        connection.executemany(
+            "INSERT INTO segment_usage VALUES (?, ?, ?, 1)",
+            [(index + 1, index % 50, toTime(visit_time)) for index, visit_time in enumerate(times[::10])]
+        )
+        downloads = [(index + 1, toTime(visit_time), "C:\\file{}".format(index)) for index, visit_time in enumerate(times[::100])]
+        connection.executemany("INSERT INTO downloads VALUES (?, ?, ?)", downloads)
+        connection.executemany(
+            "INSERT INTO downloads_url_chains VALUES (?, 0, ?)",
+            [(download[0], "https://example.test/{}".format(download[0])) for download in downloads]
+        )
+    connection.close()
+
+
+def buildChromiumCookies(path, rows, rng, now=None):
+    now = time.time() if now is None else now
+    connection = _createDatabase(path, CHROMIUM_COOKIES_SCHEMA)
+    with connection:
+        connection.executemany(
+            "INSERT INTO cookies VALUES (?, ?, ?, ?)",
+            [(sqlitePurge.webkitTime(created), "host{}.test".format(index % 500), "c{}".format(index), "v" * 32)
+                for index, created in enumerate(_timestamps(rng, rows, now))]
+        )
+    connection.close()
+
+
+def buildFirefoxPlaces(path, rows, rng, now=None):
+    now = time.time() if now is None else now
+    toTime = sqlitePurge.prTime
+    connection = _createDatabase(path, FIREFOX_PLACES_SCHEMA, wal=True)
+    with connection:
+        places = rows // 4 or 1
+        connection.executemany("INSERT INTO moz_origins VALUES (?, ?)", [(index, "example{}.test".format(index)) for index in range(1, 101)])
+        place_times = {}
+        visits = []
+        for index, visit_time in enumerate(_timestamps(rng, rows, now)):
+            place_id = rng.randrange(1, places + 1)
+            place_times[place_id] = max(place_times.get(place_id, 0), visit_time)
+            visits.append((index + 1, place_id, toTime(visit_time)))
+        connection.executemany("INSERT INTO moz_historyvisits VALUES (?, ?, ?)", visits)
+        connection.executemany(
+            "INSERT INTO moz_places VALUES (?, ?, ?, 0, ?, ?, ?)",
+            [(place_id, "https://example{}.test/".format(place_id), "Page {}".format(place_id), toTime(visit_time),
+                1 if place_id % 25 == 0 else 0, place_id % 100 + 1)
+                for place_id, visit_time in place_times.items()]
+        )
+        connection.executemany(
+            "INSERT INTO moz_inputhistory VALUES (?, ?)",
+            [(place_id, "inp{}".format(place_id)) for place_id in list(place_times)[::20]]
+        )
+    connection.close()
+
+
+def buildFirefoxCookies(path, rows, rng, now=None):
+    now = time.time() if now is None else now
+    connection = _createDatabase(path, FIREFOX_COOKIES_SCHEMA, wal=True)
+    with connection:
+        connection.executemany(
+            "INSERT INTO moz_cookies VALUES (?, ?, ?)",
+            [(index + 1, "c{}".format(index), sqlitePurge.prTime(created))
+                for index, created in enumerate(_timestamps(rng, rows, now))]
+        )
+    connection.close()
+
+
+def buildChromiumUserData(home, spec, browserDir=("Google", "Chrome")):
+    rng = random.Random(spec.seed)
+    root = os.path.join(home, "AppData", "Local", *browserDir, "User Data")
+    names = ["Default"] + ["Profile {}".format(index) for index in range(1, spec.profiles)]
+    os.makedirs(root, exist_ok=True)
+    with open(os.path.join(root, "Local State"), "w", encoding="utf-8") as f:
+        json.dump({"profile": {"info_cache": dict((name, {"name": name}) for name in names)}}, f)
+    writeFiles(os.path.join(root, "Crashpad", "reports"), 50, 4096)
+    for name in names:
+        profile = os.path.join(root, name)
+        buildChromiumHistory(os.path.join(profile, "History"), spec.historyRows, rng)
+        buildChromiumCookies(os.path.join(profile, "Network", "Cookies"), spec.historyRows // 4, rng)
+        for database in ("Favicons", "Top Sites", "Shortcuts", "Web Data"):
+            _createDatabase(os.path.join(profile, database), ("CREATE TABLE meta (key TEXT, value TEXT)",)).close()
+        for small in ("Visited Links", "Current Session", "Current Tabs", "Preferences"):
+            writeFile(os.path.join(profile, small), 16 * 1024)
+        writeFiles(os.path.join(profile, "Cache", "Cache_Data"), spec.cacheFiles, spec.cacheFileSize)
+        writeFiles(os.path.join(profile, "Code Cache", "js"), spec.cacheFiles // 4, spec.cacheFileSize)
+        writeFiles(os.path.join(profile, "Local Storage", "leveldb"), 20, 4096)
+        writeFiles(os.path.join(profile, "Sessions"), 4, 32 * 1024)
+        writeFiles(os.path.join(profile, "Extensions", "abcdefghijklmnop", "1.0"), 200, 4096)
+    return root
+
+
+def buildFirefoxProfiles(home, spec, browserDir=("Mozilla", "Firefox")):
+    rng = random.Random(spec.seed)
+    ini_dir = os.path.join(home, "AppData", "Roaming", *browserDir)
+    root = os.path.join(ini_dir, "Profiles")
+    names = ["bench{}.default-release".format(index) for index in range(spec.profiles)]
+    sections = []
+    for index, name in enumerate(names):
+        sections.append("[Profile{}]\nName=profile{}\nIsRelative=1\nPath=Profiles/{}\n".format(index, index, name))
+        profile = os.path.join(root, name)
+        buildFirefoxPlaces(os.path.join(profile, "places.sqlite"), spec.historyRows, rng)
+        buildFirefoxCookies(os.path.join(profile, "cookies.sqlite"), spec.historyRows // 4, rng)
+        _createDatabase(os.path.join(profile, "formhistory.sqlite"), ("CREATE TABLE moz_formhistory (id INTEGER PRIMARY KEY)",)).close()
+        _createDatabase(os.path.join(profile, "favicons.sqlite"), ("CREATE TABLE moz_icons (id INTEGER PRIMARY KEY)",)).close()
+        for small in ("sessionstore.jsonlz4", "prefs.js", "logins.json"):
+            writeFile(os.path.join(profile, small), 16 * 1024)
+        writeFiles(os.path.join(profile, "storage", "default", "https+++example.test", "idb"), 20, 4096)
+        cache = os.path.join(home, "AppData", "Local", *browserDir, "Profiles", name, "cache2", "entries")
+        writeFiles(cache, spec.cacheFiles, spec.cacheFileSize)
+    os.makedirs(ini_dir, exist_ok=True)
+    with open(os.path.join(ini_dir, "profiles.ini"), "w", encoding="utf-8") as f:
+        f.write("[General]\nStartWithLastProfile=1\n\n" + "\n".join(sections))
+    return root
+
+
+BUILDERS = {
+    "Google Chrome": buildChromiumUserData,
+    "Firefox": buildFirefoxProfiles,
+}
@@ -0,0 +1,80 @@
+import builtins
+import importlib
+import os
+import re
+import sys
+import types
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ADDON_PACKAGE = "globalPlugins.browserHistoryRemover"
+
+
+class Stub:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        return Stub()
+
+    def __call__(self, *args, **kwargs):
+        return Stub()
+
+
+class ConfigSection(dict):
+    def __init__(self):
+        super().__init__()
+        self.spec = {}
+
+    def __missing__(self, key):
+        if key not in self.spec:
+            raise KeyError(key)
+        section = dict((name, _default(spec)) for name, spec in self.spec[key].items())
+        self[key] = section
+        return section
+
+
+def _module(name, **attributes):
+    module = types.ModuleType(name)
+    module.__dict__.update(attributes)
+    module.__getattr__ = lambda attribute: Stub()
+    sys.modules[name] = module
+    return module
+
+
+def installStubs(configPath):
+    _module("addonHandler", initTranslation=lambda: setattr(builtins, "_", lambda text: text))
+    _module("globalPluginHandler", GlobalPlugin=Stub)
+    _module("scriptHandler", script=lambda **kwargs: (lambda function: function))
+    _module("ui", message=lambda text: None)
+    _module("wx", Panel=Stub, Dialog=Stub, CallAfter=lambda function, *args, **kwargs: function(*args, **kwargs))
+    _module("gui", messageBox=lambda *args, **kwargs: None, guiHelper=Stub(), mainFrame=Stub())
+    _module("config", conf=ConfigSection())
+    _module("globalVars", appArgs=types.SimpleNamespace(configPath=configPath))
+
+
+def _default(spec):
+    match = re.search(r"default=([^,)]*)", spec)
+    value = match.group(1).strip("'\"") if match else None
+    if spec.startswith("boolean"):
+        return value == "True"
+    if spec.startswith("integer"):
+        return int(value)
+    if spec.startswith("float"):
+        return float(value)
+    return value
+
+
+def loadAddon(configPath):
+    installStubs(configPath)
+    if REPO_DIR not in sys.path:
+        sys.path.insert(0, REPO_DIR)
+    try:
+        importlib.import_module(ADDON_PACKAGE)
+        engine = importlib.import_module(ADDON_PACKAGE + ".engine")
+    except ImportError as e:
+        sys.exit("Cannot import the add-on ({}). Install its runtime dependencies, e.g. pip install psutil.".format(e))
+    conf = sys.modules["config"].conf
+    conf["browserHistoryRemover"] = dict(
+        (key, _default(spec)) for key, spec in conf.spec["browserHistoryRemover"].items()
+    )
+    return engine
@@ -0,0 +1,93 @@
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from common import loadModule
+
+scanIndex = loadModule("scanIndex")
+
+
+def buildCache(root, dirs, filesPerDir):
+    payload = b"x" * 256
+    for index in range(dirs):
+        directory = os.path.join(root, "CacheStorage", "{:04x}".format(index // 16), "{:04x}".format(index))
+        os.makedirs(directory)
+        for number in range(filesPerDir):
+            with open(os.path.join(directory, "f_{:04x}".format(number)), "wb") as f:
+                f.write(payload)
+
+
+def walkTotals(root):
+    files = 0
+    total = 0
+    for dirPath, dirNames, fileNames in os.walk(root):
+        for name in fileNames:
+            files += 1
+            total += os.stat(os.path.join(dirPath, name)).st_size
+    return files, total
+
+
+def touchSome(root, dirs, changed):
+    for index in range(0, dirs, max(1, dirs // changed)):
+        directory = os.path.join(root, "CacheStorage", "{:04x}".format(index // 16), "{:04x}".format(index))
+        with open(os.path.join(directory, "new"), "wb") as f:
+            f.write(b"y" * 100)
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold os.walk vs persistent scan index")
+    parser.add_argument("--dirs", type=int, default=2000)
+    parser.add_argument("--files", type=int, default=20, help="files per directory")
+    parser.add_argument("--changed", type=int, default=20, help="directories changed between runs")
+    args = parser.parse_args()
+
+    work = tempfile.mkdtemp(prefix="bhr_index_")
+    try:
+        root = os.path.join(work, "profile")
+        buildCache(root, args.dirs, args.files)
+        index_path = os.path.join(work, "scanIndex.json")
+
+        walked, expected = timed(lambda: walkTotals(root))
+        index = scanIndex.ScanIndex(index_path)
+        cold, result = timed(lambda: index.summarize(root, [root], root))
+        assert result == expected, (result, expected)
+        index.save(root)
+
+        touchSome(root, args.dirs, args.changed)
+        walked_again, expected = timed(lambda: walkTotals(root))
+        index = scanIndex.ScanIndex(index_path)
+        warm, result = timed(lambda: index.summarize(root, [root], root))
+        assert result == expected, (result, expected)
+
+        index.save(root)
+
+        shutil.rmtree(root)
+        buildCache(root, args.dirs, args.files)
+        walked_cleared, expected = timed(lambda: walkTotals(root))
+        index = scanIndex.ScanIndex(index_path)
+        cleared, result = timed(lambda: (index.summarize(root, [root], root), index.save(root))[0])
+        assert result == expected, (result, expected)
+
+        print("files: {}  directories: {}  changed: {}".format(expected[0], args.dirs, args.changed))
+        print("cold os.walk:         {:.3f}s".format(walked))
+        print("index, first scan:    {:.3f}s".format(cold))
+        print("os.walk after edit:   {:.3f}s".format(walked_again))
+        print("index after edit:     {:.3f}s  speedup {:.1f}x".format(warm, walked_again / warm))
+        print("os.walk after clear:  {:.3f}s".format(walked_cleared))
+        print("index after clear:    {:.3f}s  speedup {:.1f}x (includes saving the index)".format(
+            cleared, walked_cleared / cleared
+        ))
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from common import loadModule
+
+shredder = loadModule("shredder")
+
+
+class Entry:
+    def __init__(self, path):
+        self.path = path
+        self.name = os.path.basename(path)
+
+    def is_dir(self, follow_symlinks=True):
+        return False
+
+
+def buildFiles(root, count, size):
+    payload = os.urandom(min(size, 1024 * 1024))
+    paths = []
+    for number in range(count):
+        path = os.path.join(root, "Cookies-{:06d}".format(number))
+        with open(path, "wb") as f:
+            remaining = size
+            while remaining > 0:
+                f.write(payload[:remaining])
+                remaining -= len(payload)
+        paths.append(path)
+    return paths
+
+
+def naiveShred(paths, chunkSize):
+    for path in paths:
+        remaining = os.path.getsize(path)
+        with open(path, "r+b") as f:
+            while remaining > 0:
+                chunk = min(chunkSize, remaining)
+                f.write(bytes(chunk))
+                f.flush()
+                os.fsync(f.fileno())
+                remaining -= chunk
+        os.remove(path)
+
+
+def timeRun(base_dir, count, size, run):
+    root = tempfile.mkdtemp(prefix="bhr_shred_", dir=base_dir)
+    try:
+        paths = buildFiles(root, count, size)
+        start = time.perf_counter()
+        run(paths)
+        elapsed = time.perf_counter() - start
+        left = len(os.listdir(root))
+        return elapsed, left
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def report(label, elapsed, total_bytes, count, left, baseline):
+    print("{:<24} {:.3f}s  {:8.1f} MB/s  {:8.0f} files/s  {:>6}  left={}".format(
+        label,
+        elapsed,
+        total_bytes / elapsed / (1024 * 1024),
+        count / elapsed,
+        "{:.2f}x".format(baseline / elapsed) if baseline else "",
+        left
+    ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Secure overwrite throughput compared with plain deletion")
+    parser.add_argument("--dir", default=None, help="folder on the disk to measure (default: the system temp folder)")
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--size", type=int, default=512 * 1024, help="bytes per file")
+    parser.add_argument("--chunk-sizes", type=int, nargs="+", default=[64 * 1024, shredder.CHUNK_SIZE])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--no-naive", action="store_true", help="skip the per-chunk allocation baseline")
+    args = parser.parse_args()
+
+    total_bytes = args.files * args.size
+    print("files: {}  size: {} bytes  total: {:.1f} MB".format(args.files, args.size, total_bytes / (1024 * 1024)))
+
+    elapsed, left = timeRun(args.dir, args.files, args.size, lambda paths: [os.remove(path) for path in paths])
+    report("unlink only", elapsed, total_bytes, args.files, left, None)
+
+    baseline = None
+    if not args.no_naive:
+        elapsed, left = timeRun(args.dir, args.files, args.size, lambda paths: naiveShred(paths, 64 * 1024))
+        baseline = elapsed
+        report("naive 64KB", elapsed, total_bytes, args.files, left, None)
+
+    for chunkSize in args.chunk_sizes:
+        for workers in args.workers:
+            engine = shredder.Shredder(workers=workers, chunkSize=chunkSize)
+            elapsed, left = timeRun(
+                args.dir, args.files, args.size,
+                lambda paths: engine.shredTargets((Entry(path), "cookies") for path in paths)
+            )
+            report("chunk={}KB workers={}".format(chunkSize // 1024, workers), elapsed, total_bytes, args.files, left, baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from nvdaStubs import ADDON_PACKAGE
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFERRED_MODULES = (
+    ADDON_PACKAGE + ".engine",
+    ADDON_PACKAGE + ".dialogs",
+    ADDON_PACKAGE + ".exitWatcher",
+    "psutil",
+    "sqlite3",
+    "zipfile",
+    "concurrent.futures",
+)
+
+NVDA_PRELOADED = ("logging", "threading", "shutil", "tempfile", "queue", "json", "datetime")
+
+PROBE = """
+import json, sys, time
+for name in {preloaded!r}:
+    __import__(name)
+sys.path.insert(0, {benchDir!r})
+from nvdaStubs import REPO_DIR, installStubs
+installStubs({configPath!r})
+sys.path.insert(0, REPO_DIR)
+before = set(sys.modules)
+start = time.perf_counter()
+package = __import__({package!r}, fromlist=["GlobalPlugin"])
+plugin = package.GlobalPlugin()
+startup = time.perf_counter() - start
+loaded = set(sys.modules) - before
+start = time.perf_counter()
+__import__({package!r} + ".dialogs")
+firstUse = time.perf_counter() - start
+plugin.terminate()
+print(json.dumps({{
+    "startup": startup,
+    "firstUse": firstUse,
+    "startupModules": len(loaded),
+    "deferred": dict((name, name not in loaded) for name in {deferred!r}),
+}}))
+"""
+
+
+def probe(configPath):
+    code = PROBE.format(
+        preloaded=NVDA_PRELOADED,
+        benchDir=BENCH_DIR,
+        configPath=configPath,
+        package=ADDON_PACKAGE,
+        deferred=DEFERRED_MODULES
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the startup cost the add-on adds to NVDA, each run in a fresh interpreter")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--json", help="write machine-readable results to this file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bhr_startup_") as configPath:
+        samples = [probe(configPath) for run in range(args.runs)]
+
+    report = {
+        "python": sys.version.split()[0],
+        "runs": args.runs,
+        "startupMs": round(statistics.median(sample["startup"] for sample in samples) * 1000, 2),
+        "firstUseMs": round(statistics.median(sample["firstUse"] for sample in samples) * 1000, 2),
+        "startupModules": samples[0]["startupModules"],
+        "deferred": samples[0]["deferred"],
+    }
+    print("Plugin import and construction: {startupMs} ms median over {runs} runs, {startupModules} modules".format(**report))
+    print("First use (engine and dialogs): {firstUseMs} ms median".format(**report))
+    for name, deferred in report["deferred"].items():
+        print("  {:<49} {}".format(name, "deferred" if deferred else "LOADED AT STARTUP"))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
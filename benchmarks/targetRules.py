@@ -0,0 +1,104 @@
+import argparse
+import os
+import shutil
+import tempfile
+import timeit
+
+from common import loadModule
+
+fileWalker = loadModule("fileWalker")
+targetRules = loadModule("targetRules")
+
+LEGACY_FILE_KEYWORDS = [
+    'history', 'cache', 'cookies', 'webdata', 'favicons',
+    'logins', 'formhistory', 'places', 'session',
+    'top sites', 'shortcuts', 'thumbnails', 'visited', 'downloads'
+]
+
+LEGACY_DIR_KEYWORDS = [
+    'cache', 'storage', 'session', 'local storage',
+    'sync data', 'indexeddb', 'websql', 'file system',
+    'gpucache', 'code cache', 'service worker'
+]
+
+PROFILE_FILES = (
+    "History", "History-journal", "Cookies", "Favicons", "Top Sites", "Shortcuts", "Visited Links",
+    "Web Data", "Login Data", "Preferences", "Secure Preferences", "Current Session", "Last Tabs",
+)
+
+PROFILE_DIRS = ("Cache", "Code Cache", "GPUCache", "Local Storage", "IndexedDB", "Sessions", "Sync Data")
+
+UNRELATED_DIRS = ("Extensions", "Crashpad", "component_crx_cache", "optimization_guide_model_store")
+
+
+def legacyFile(name):
+    name = name.lower()
+    return any(keyword in name for keyword in LEGACY_FILE_KEYWORDS)
+
+
+def legacyDir(name):
+    name = name.lower()
+    return any(keyword in name for keyword in LEGACY_DIR_KEYWORDS)
+
+
+def touch(path):
+    with open(path, "wb") as f:
+        f.write(b"x")
+
+
+def buildUserData(root, profiles, unrelatedFiles):
+    profile_paths = []
+    for index in range(profiles):
+        profile = os.path.join(root, "Default" if index == 0 else "Profile {}".format(index))
+        profile_paths.append(profile)
+        os.makedirs(profile)
+        for name in PROFILE_FILES:
+            touch(os.path.join(profile, name))
+        for name in PROFILE_DIRS:
+            os.makedirs(os.path.join(profile, name))
+            touch(os.path.join(profile, name, "data_0"))
+        extension = os.path.join(profile, "Extensions", "abcdef", "1.0")
+        os.makedirs(extension)
+        for number in range(unrelatedFiles // 10):
+            touch(os.path.join(extension, "f_{:06x}.js".format(number)))
+    for name in UNRELATED_DIRS:
+        directory = os.path.join(root, name, "data")
+        os.makedirs(directory)
+        for number in range(unrelatedFiles):
+            touch(os.path.join(directory, "f_{:06x}".format(number)))
+    return profile_paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keyword tree walk vs compiled target rules")
+    parser.add_argument("--profiles", type=int, default=3)
+    parser.add_argument("--unrelated", type=int, default=5000, help="files per unrelated top-level folder")
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix="bhr_rules_")
+    try:
+        profile_paths = buildUserData(root, args.profiles, args.unrelated)
+        rules = targetRules.getTargetRules("Google Chrome")
+
+        def legacy():
+            return [entry.path for entry, category in fileWalker.scanTargets(root, legacyFile, legacyDir)]
+
+        def compiled():
+            return [entry.path for entry, category in rules.scanPaths(profile_paths)]
+
+        legacy_paths = set(legacy())
+        compiled_paths = set(compiled())
+        walked = min(timeit.repeat(legacy, number=1, repeat=5))
+        looked_up = min(timeit.repeat(compiled, number=1, repeat=5))
+        print("keyword walk:   {:.4f}s  {} targets".format(walked, len(legacy_paths)))
+        print("compiled rules: {:.4f}s  {} targets".format(looked_up, len(compiled_paths)))
+        print("speedup:        {:.1f}x".format(walked / looked_up))
+        print("only matched by keywords: {}".format(
+            sorted(os.path.relpath(path, root) for path in legacy_paths - compiled_paths)
+        ))
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import argparse
+import json
+import logging
+import sys
+from .browsers import BROWSERS
+from .sqlitePurge import PURGE_RANGES
+from .sweep import DEFAULT_SWEEP_WORKERS, findHomes, getDefaultUsersRoot, sweep
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m globalPlugins.browserHistoryRemover",
+        description="Clear browser history for every user home folder without NVDA and print a JSON summary."
+    )
+    parser.add_argument("--root", default=getDefaultUsersRoot(), help="folder holding the user home folders (default: %(default)s)")
+    parser.add_argument("--home", action="append", help="clear only this home folder; can be given more than once")
+    parser.add_argument("--browser", action="append", choices=BROWSERS, help="clear only this browser; can be given more than once")
+    parser.add_argument("--range", choices=["files"] + list(PURGE_RANGES), default="files", help="what to remove, as in the Time range setting (default: %(default)s)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_SWEEP_WORKERS, help="home folders cleared at the same time (default: %(default)s)")
+    parser.add_argument("--dry-run", action="store_true", help="report what would be removed without removing it")
+    parser.add_argument("--force", action="store_true", help="also clear browsers that are running")
+    parser.add_argument("--shred", action="store_true", help="overwrite history, cookie, form and login files before deleting them")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.ERROR)
+    try:
+        homes = args.home or findHomes(args.root)
+    except OSError as e:
+        parser.error("cannot list {}: {}".format(args.root, e.strerror))
+
+    summary = sweep(
+        homes,
+        browsers=args.browser or BROWSERS,
+        range_key=args.range,
+        workers=args.workers,
+        dryRun=args.dry_run,
+        force=args.force,
+        shred=args.shred
+    )
+    json.dump(summary, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    totals = summary["totals"]
+    return 1 if totals["errors"] or totals["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
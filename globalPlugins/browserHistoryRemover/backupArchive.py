@@ -0,0 +1,112 @@
+import os
+import shutil
+import tempfile
+import time
+import zipfile
+
+ARCHIVE_EXTENSION = ".zip"
+CHUNK_SIZE = 1024 * 1024
+COMPRESSION_LEVEL = 6
+
+
+def isBackupArchive(path):
+    return path.lower().endswith(ARCHIVE_EXTENSION) and os.path.isfile(path)
+
+
+class ArchiveWriter:
+    def __init__(self, archive_path):
+        self.archive_path = archive_path
+        self.partial_path = archive_path + ".partial"
+        self._zip = zipfile.ZipFile(
+            self.partial_path,
+            "w",
+            compression=zipfile.ZIP_DEFLATED,
+            compresslevel=COMPRESSION_LEVEL,
+            allowZip64=True
+        )
+
+    def addFile(self, src_path, relative_path, snapshot=None):
+        if snapshot is None:
+            return self._addStream(src_path, relative_path)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.partial_path), suffix=".tmp")
+        os.close(fd)
+        try:
+            snapshot(src_path, tmp_path)
+            src_stat = os.stat(src_path)
+            os.utime(tmp_path, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+            return self._addStream(tmp_path, relative_path)
+        finally:
+            os.remove(tmp_path)
+
+    def _addStream(self, src_path, relative_path):
+        info = zipfile.ZipInfo.from_file(src_path, relative_path.replace(os.sep, "/"))
+        info.compress_type = zipfile.ZIP_DEFLATED
+        size = 0
+        with open(src_path, "rb") as src, self._zip.open(info, "w", force_zip64=True) as dest:
+            while True:
+                chunk = src.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                dest.write(chunk)
+                size += len(chunk)
+        return size
+
+    def commit(self):
+        self._zip.close()
+        os.replace(self.partial_path, self.archive_path)
+
+    def discard(self):
+        try:
+            self._zip.close()
+        except Exception:
+            pass
+        try:
+            os.remove(self.partial_path)
+        except OSError:
+            pass
+
+
+def resolveMemberPath(dest_root, name):
+    dest_path = os.path.normpath(os.path.join(dest_root, *name.split("/")))
+    root = os.path.normpath(dest_root)
+    if os.path.commonpath([root, dest_path]) != root or dest_path == root:
+        raise ValueError("Unsafe backup member: {}".format(name))
+    return dest_path
+
+
+def archiveHasFiles(archive_path):
+    try:
+        with zipfile.ZipFile(archive_path) as archive:
+            return any(not info.is_dir() for info in archive.infolist())
+    except (OSError, zipfile.BadZipFile):
+        return False
+
+
+def extractArchive(archive_path, dest_root, progress):
+    copied_count = 0
+    failed_count = 0
+    failed_files = []
+
+    with zipfile.ZipFile(archive_path) as archive:
+        for info in archive.infolist():
+            if progress.cancelled:
+                break
+            if info.is_dir():
+                continue
+            dest_path = None
+            try:
+                dest_path = resolveMemberPath(dest_root, info.filename)
+                os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+                with archive.open(info) as src, open(dest_path, "wb") as dest:
+                    shutil.copyfileobj(src, dest, CHUNK_SIZE)
+                mtime = time.mktime(info.date_time + (0, 0, -1))
+                os.utime(dest_path, (mtime, mtime))
+                copied_count += 1
+                progress.advance(bytes=info.file_size)
+            except Exception:
+                if dest_path and os.path.isfile(dest_path):
+                    os.remove(dest_path)
+                failed_count += 1
+                failed_files.append(os.path.basename(info.filename))
+
+    return copied_count, failed_count, failed_files
@@ -0,0 +1,121 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+CHUNK_SIZE = 1024 * 1024
+OBJECTS_DIR = "objects"
+INDEX_FILE = "index.json"
+
+
+def copyWithDigest(src_path, dest_path, chunkSize=CHUNK_SIZE):
+    digest = hashlib.sha256()
+    size = 0
+    with open(src_path, "rb") as src, open(dest_path, "wb") as dest:
+        while True:
+            chunk = src.read(chunkSize)
+            if not chunk:
+                break
+            digest.update(chunk)
+            dest.write(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def hashFile(path, chunkSize=CHUNK_SIZE):
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunkSize)
+            if not chunk:
+                break
+            digest.update(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def isObjectStore(path):
+    return os.path.basename(os.path.normpath(path)) == OBJECTS_DIR
+
+
+class BackupStore:
+    def __init__(self, store_path):
+        self.store_path = store_path
+        self.objects_path = os.path.join(store_path, OBJECTS_DIR)
+        self.index_path = os.path.join(self.objects_path, INDEX_FILE)
+        self._index = self._loadIndex()
+        self._newIndex = {}
+        self.reused = 0
+        self.stored = 0
+
+    def _loadIndex(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def objectPath(self, digest):
+        return os.path.join(self.objects_path, digest[:2], digest)
+
+    def addFile(self, src_path, relative_path, stat, dest_path, signature=None, snapshot=None):
+        key = relative_path.replace(os.sep, "/")
+        if signature is None:
+            signature = [stat.st_size, stat.st_mtime_ns]
+        cached = self._index.get(key)
+        if (
+            isinstance(cached, dict)
+            and cached.get("signature") == signature
+            and os.path.exists(self.objectPath(cached["digest"]))
+        ):
+            digest = cached["digest"]
+            size = cached["size"]
+            self.reused += 1
+        else:
+            digest, size = self._ingest(src_path, stat, snapshot)
+        self._newIndex[key] = {"signature": signature, "size": size, "digest": digest}
+        self._link(self.objectPath(digest), dest_path)
+        return digest, size
+
+    def _ingest(self, src_path, stat, snapshot=None):
+        os.makedirs(self.objects_path, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.objects_path, suffix=".tmp")
+        os.close(fd)
+        try:
+            if snapshot:
+                snapshot(src_path, tmp_path)
+                digest, size = hashFile(tmp_path)
+            else:
+                digest, size = copyWithDigest(src_path, tmp_path)
+            object_path = self.objectPath(digest)
+            if os.path.exists(object_path):
+                os.remove(tmp_path)
+                self.reused += 1
+            else:
+                os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+                os.makedirs(os.path.dirname(object_path), exist_ok=True)
+                os.replace(tmp_path, object_path)
+                self.stored += 1
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        return digest, size
+
+    def _link(self, object_path, dest_path):
+        try:
+            os.link(object_path, dest_path)
+        except OSError:
+            shutil.copy2(object_path, dest_path)
+
+    def save(self):
+        if not self._newIndex:
+            return
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._newIndex, f)
+        os.replace(tmp_path, self.index_path)
@@ -0,0 +1,43 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_IO_LIMIT = 3
+
+
+class BatchRunner:
+    def __init__(self, ioLimit=DEFAULT_IO_LIMIT):
+        self.ioSlots = threading.BoundedSemaphore(ioLimit)
+
+    def run(self, items, worker):
+        results = {}
+        if not items:
+            return results
+        with ThreadPoolExecutor(max_workers=len(items), thread_name_prefix="browserHistoryRemoverBatch") as executor:
+            futures = dict((item, executor.submit(worker, item, self.ioSlots)) for item in items)
+            for item, future in futures.items():
+                try:
+                    results[item] = future.result()
+                except Exception as e:
+                    logging.error("Error in batch worker for {}: {}".format(item, str(e)))
+                    results[item] = (False, str(e))
+        return results
+
+
+def runAlongside(background, foreground):
+    background_result = [None]
+
+    def runBackground():
+        try:
+            background_result[0] = background()
+        except Exception as e:
+            logging.error("Error in pipelined task: {}".format(str(e)))
+            background_result[0] = (False, str(e))
+
+    thread = threading.Thread(target=runBackground, name="browserHistoryRemoverPipeline", daemon=True)
+    thread.start()
+    try:
+        foreground_result = foreground()
+    finally:
+        thread.join()
+    return foreground_result, background_result[0]
@@ -0,0 +1,58 @@
+import os
+
+BROWSERS = [
+    "Google Chrome",
+    "Microsoft Edge",
+    "Firefox",
+    "Opera",
+    "Brave",
+    "Vivaldi",
+    "Chromium",
+    "Waterfox",
+    "Pale Moon",
+    "Basilisk",
+    "SeaMonkey"
+]
+
+BROWSER_PROCESSES = {
+    "Google Chrome": ["chrome.exe"],
+    "Microsoft Edge": ["msedge.exe"],
+    "Firefox": ["firefox.exe"],
+    "Opera": ["opera.exe"],
+    "Brave": ["brave.exe"],
+    "Vivaldi": ["vivaldi.exe"],
+    "Chromium": ["chromium.exe"],
+    "Waterfox": ["waterfox.exe"],
+    "Pale Moon": ["palemoon.exe"],
+    "Basilisk": ["basilisk.exe"],
+    "SeaMonkey": ["seamonkey.exe"]
+}
+
+
+def getBrowserPath(browser, home=None):
+    user_profile = home or os.path.expanduser("~")
+    appdata_local = os.path.join(user_profile, "AppData", "Local")
+    appdata_roaming = os.path.join(user_profile, "AppData", "Roaming")
+
+    paths = {
+        "Google Chrome": os.path.join(appdata_local, "Google", "Chrome", "User Data"),
+        "Microsoft Edge": os.path.join(appdata_local, "Microsoft", "Edge", "User Data"),
+        "Firefox": os.path.join(appdata_roaming, "Mozilla", "Firefox", "Profiles"),
+        "Opera": os.path.join(appdata_roaming, "Opera Software", "Opera Stable"),
+        "Brave": os.path.join(appdata_local, "BraveSoftware", "Brave-Browser", "User Data"),
+        "Vivaldi": os.path.join(appdata_local, "Vivaldi", "User Data"),
+        "Chromium": os.path.join(appdata_local, "Chromium", "User Data"),
+        "Waterfox": os.path.join(appdata_roaming, "Waterfox", "Profiles"),
+        "Pale Moon": os.path.join(appdata_roaming, "Moonchild Productions", "Pale Moon", "Profiles"),
+        "Basilisk": os.path.join(appdata_roaming, "Moonchild Productions", "Basilisk", "Profiles"),
+        "SeaMonkey": os.path.join(appdata_roaming, "Mozilla", "SeaMonkey", "Profiles")
+    }
+
+    return paths.get(browser, None)
+
+
+def isBrowserInstalled(browser):
+    browser_path = getBrowserPath(browser)
+    if browser_path and os.path.exists(browser_path):
+        return True
+    return False
@@ -0,0 +1,127 @@
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_WORKERS = 4
+BATCH_SIZE = 256
+
+
+def _ignoreError(error):
+    pass
+
+
+def _ignoreRemoved(path):
+    pass
+
+
+def _unlinkBatch(paths, onError, onRemoved=_ignoreRemoved):
+    removed = 0
+    for path in paths:
+        try:
+            os.remove(path)
+            removed += 1
+            onRemoved(path)
+        except OSError as e:
+            onError(e)
+    return removed
+
+
+def _removeSubtree(path, onError):
+    shutil.rmtree(path, onerror=lambda function, failed_path, excInfo: onError(excInfo[1]))
+
+
+class DeletionEngine:
+    def __init__(self, workers=DEFAULT_WORKERS, batchSize=BATCH_SIZE, onError=None, onRemoved=None):
+        self.workers = max(1, workers)
+        self.batchSize = max(1, batchSize)
+        self.onError = onError or _ignoreError
+        self.onRemoved = onRemoved or _ignoreRemoved
+
+    def removeTargets(self, targets):
+        if self.workers == 1:
+            return self._removeSerial(targets)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return self._removeParallel(targets, executor)
+
+    def _removeSerial(self, targets):
+        deleted_files = 0
+        deleted_dirs = 0
+        for entry, category in targets:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    _removeSubtree(entry.path, self.onError)
+                    if os.path.lexists(entry.path):
+                        continue
+                    deleted_dirs += 1
+                else:
+                    os.remove(entry.path)
+                    deleted_files += 1
+                self.onRemoved(entry.path)
+            except Exception as e:
+                self.onError(e)
+        return deleted_files, deleted_dirs
+
+    def _removeParallel(self, targets, executor):
+        fileFutures = []
+        pendingDirs = []
+        fileBatch = []
+        deleted_dirs = 0
+
+        for entry, category in targets:
+            try:
+                isDir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if isDir:
+                futures, subdirs = self._submitTree(entry.path, executor)
+                pendingDirs.append((entry.path, futures, subdirs))
+            else:
+                fileBatch.append(entry.path)
+                if len(fileBatch) >= self.batchSize:
+                    fileFutures.append(executor.submit(_unlinkBatch, fileBatch, self.onError, self.onRemoved))
+                    fileBatch = []
+        if fileBatch:
+            fileFutures.append(executor.submit(_unlinkBatch, fileBatch, self.onError, self.onRemoved))
+
+        deleted_files = 0
+        for future in fileFutures:
+            deleted_files += future.result()
+
+        for dir_path, futures, subdirs in pendingDirs:
+            for future in futures:
+                future.result()
+            for subdir in subdirs:
+                try:
+                    os.rmdir(subdir)
+                except OSError:
+                    pass
+            try:
+                os.rmdir(dir_path)
+            except OSError:
+                _removeSubtree(dir_path, self.onError)
+                if os.path.lexists(dir_path):
+                    continue
+            deleted_dirs += 1
+            self.onRemoved(dir_path)
+
+        return deleted_files, deleted_dirs
+
+    def _submitTree(self, dir_path, executor):
+        futures = []
+        subdirs = []
+        batch = []
+        for root, dirs, files in os.walk(dir_path, onerror=self.onError):
+            if root != dir_path:
+                subdirs.append(root)
+            for name in dirs:
+                if os.path.islink(os.path.join(root, name)):
+                    files.append(name)
+            for name in files:
+                batch.append(os.path.join(root, name))
+                if len(batch) >= self.batchSize:
+                    futures.append(executor.submit(_unlinkBatch, batch, self.onError))
+                    batch = []
+        if batch:
+            futures.append(executor.submit(_unlinkBatch, batch, self.onError))
+        subdirs.reverse()
+        return futures, subdirs
@@ -0,0 +1,715 @@
+import addonHandler
+import ui
+import gui
+import wx
+import os
+import logging
+import time
+import config
+from .browsers import BROWSERS, getBrowserPath, isBrowserInstalled
+from .jobs import Job, formatSize
+from .metrics import OperationMetrics
+from .progress import JobProgress
+from .backupArchive import ARCHIVE_EXTENSION
+from .engine import (
+    BACKUP_FORMATS,
+    PURGE_RANGE_CHOICES,
+    clearAllBrowsers,
+    clearHistory,
+    copyHistoryFiles,
+    describePlan,
+    findBackupKinds,
+    getBackupBasePath,
+    getBatchBrowsers,
+    getBrowserProcesses,
+    getPurgeRangeLabel,
+    planHistoryRemoval,
+    restoreHistoryFiles,
+    runRecorded,
+)
+
+addonHandler.initTranslation()
+
+PROGRESS_ANNOUNCE_INTERVAL = 5.0
+
+
+class FocusableStaticText(wx.Panel):
+    def __init__(self, parent, label=""):
+        super().__init__(parent, style=wx.TAB_TRAVERSAL | wx.BORDER_SIMPLE)
+        self.SetBackgroundColour(wx.SystemSettings.GetColour(wx.SYS_COLOUR_WINDOW))
+        sizer = wx.BoxSizer(wx.VERTICAL)
+        self.textCtrl = wx.StaticText(self, label=label)
+        sizer.Add(self.textCtrl, 1, wx.ALL | wx.EXPAND, 5)
+        self.SetSizer(sizer)
+        self.Bind(wx.EVT_SET_FOCUS, self.onFocus)
+        self.Bind(wx.EVT_KILL_FOCUS, self.onKillFocus)
+
+    def onFocus(self, evt):
+        self.SetBackgroundColour(wx.SystemSettings.GetColour(wx.SYS_COLOUR_HIGHLIGHT))
+        self.textCtrl.SetForegroundColour(wx.SystemSettings.GetColour(wx.SYS_COLOUR_HIGHLIGHTTEXT))
+        self.Refresh()
+        evt.Skip()
+
+    def onKillFocus(self, evt):
+        self.SetBackgroundColour(wx.SystemSettings.GetColour(wx.SYS_COLOUR_WINDOW))
+        self.textCtrl.SetForegroundColour(wx.SystemSettings.GetColour(wx.SYS_COLOUR_WINDOWTEXT))
+        self.Refresh()
+        evt.Skip()
+
+    def SetLabel(self, label):
+        self.textCtrl.SetLabel(label)
+
+
+class ConfigurationDialog(wx.Dialog):
+    def __init__(self, parent):
+        super().__init__(parent, title=_("Browser History Remover - Configuration"), size=(550, 680))
+        self.Centre()
+        self.initUI()
+        self.loadSettings()
+        self.Bind(wx.EVT_CHAR_HOOK, self.onKeyDown)
+        self.copyHistoryCheckBox.SetFocus()
+
+    def initUI(self):
+        mainSizer = wx.BoxSizer(wx.VERTICAL)
+        sHelper = gui.guiHelper.BoxSizerHelper(self, orientation=wx.VERTICAL)
+
+        self.copyHistoryCheckBox = sHelper.addItem(
+            wx.CheckBox(self, label=_("Co&py browser history before deletion"))
+        )
+
+        backupFormatLabel = wx.StaticText(self, label=_("Backup &format:"))
+        sHelper.addItem(backupFormatLabel)
+
+        self.backupFormatCombo = sHelper.addItem(
+            wx.ComboBox(self, choices=[label for key, label in BACKUP_FORMATS], style=wx.CB_READONLY)
+        )
+
+        keepCountLabel = wx.StaticText(self, label=_("Number of backups to &keep per browser (0 for no limit):"))
+        sHelper.addItem(keepCountLabel)
+
+        self.keepCountSpin = sHelper.addItem(wx.SpinCtrl(self, min=0, max=1000))
+
+        maxAgeLabel = wx.StaticText(self, label=_("Remove backups older than this many &days (0 to keep them):"))
+        sHelper.addItem(maxAgeLabel)
+
+        self.maxAgeSpin = sHelper.addItem(wx.SpinCtrl(self, min=0, max=3650))
+
+        quotaLabel = wx.StaticText(self, label=_("Maximum backup size per browser in &MB (0 for no limit):"))
+        sHelper.addItem(quotaLabel)
+
+        self.quotaSpin = sHelper.addItem(wx.SpinCtrl(self, min=0, max=1048576))
+
+        purgeRangeLabel = wx.StaticText(self, label=_("&Time range to remove:"))
+        sHelper.addItem(purgeRangeLabel)
+
+        self.purgeRangeCombo = sHelper.addItem(
+            wx.ComboBox(self, choices=[label for key, label in PURGE_RANGE_CHOICES], style=wx.CB_READONLY)
+        )
+
+        self.instantRemovalCheckBox = sHelper.addItem(
+            wx.CheckBox(self, label=_("&Instant removal (finish deleting files in the background)"))
+        )
+
+        self.secureOverwriteCheckBox = sHelper.addItem(
+            wx.CheckBox(self, label=_("&Overwrite history, cookie, form and login files before deleting them (slower)"))
+        )
+
+        self.profileOperationsCheckBox = sHelper.addItem(
+            wx.CheckBox(self, label=_("Save a performance p&rofile of each operation"))
+        )
+
+        self.autoClearCheckBox = sHelper.addItem(
+            wx.CheckBox(self, label=_("R&emove history of the default browser automatically when it exits"))
+        )
+
+        defaultBrowserLabel = wx.StaticText(self, label=_("Select default browser for &quick remove:"))
+        sHelper.addItem(defaultBrowserLabel)
+
+        self.defaultBrowserCombo = sHelper.addItem(
+            wx.ComboBox(self, choices=BROWSERS, style=wx.CB_READONLY)
+        )
+        self.defaultBrowserCombo.Bind(wx.EVT_COMBOBOX, self.onBrowserChange)
+
+        self.notePanel = FocusableStaticText(self, label="")
+        self.notePanel.SetMinSize((500, 60))
+        sHelper.addItem(self.notePanel, flag=wx.EXPAND)
+
+        buttonSizer = wx.BoxSizer(wx.HORIZONTAL)
+
+        self.saveButton = wx.Button(self, label=_("&Save"))
+        self.saveButton.Bind(wx.EVT_BUTTON, self.onSave)
+        buttonSizer.Add(self.saveButton, flag=wx.RIGHT, border=10)
+
+        self.cancelButton = wx.Button(self, wx.ID_CANCEL, label=_("&Cancel"))
+        self.cancelButton.Bind(wx.EVT_BUTTON, self.onCancel)
+        buttonSizer.Add(self.cancelButton)
+
+        sHelper.addItem(buttonSizer)
+
+        mainSizer.Add(sHelper.sizer, border=10, flag=wx.ALL | wx.EXPAND, proportion=1)
+        self.SetSizer(mainSizer)
+
+    def updateNoteText(self):
+        selection = self.defaultBrowserCombo.GetSelection()
+        if selection != wx.NOT_FOUND:
+            browser = BROWSERS[selection]
+        else:
+            browser = config.conf["browserHistoryRemover"]["defaultBrowser"]
+        noteText = _("Note: Assign the shortcut to remove the history of {browser} via quick shortcut.\nDefault shortcut: NVDA+Alt+D").format(browser=browser)
+        self.notePanel.SetLabel(noteText)
+
+    def onBrowserChange(self, evt):
+        self.updateNoteText()
+        evt.Skip()
+
+    def loadSettings(self):
+        self.copyHistoryCheckBox.SetValue(config.conf["browserHistoryRemover"]["copyHistoryBeforeDeletion"])
+        self.instantRemovalCheckBox.SetValue(config.conf["browserHistoryRemover"]["instantRemoval"])
+        self.secureOverwriteCheckBox.SetValue(config.conf["browserHistoryRemover"]["secureOverwrite"])
+        self.autoClearCheckBox.SetValue(config.conf["browserHistoryRemover"]["autoClearOnExit"])
+        self.profileOperationsCheckBox.SetValue(config.conf["browserHistoryRemover"]["profileOperations"])
+        purgeRanges = [key for key, label in PURGE_RANGE_CHOICES]
+        purgeRange = config.conf["browserHistoryRemover"]["purgeRange"]
+        self.purgeRangeCombo.SetSelection(purgeRanges.index(purgeRange) if purgeRange in purgeRanges else 0)
+        backupFormats = [key for key, label in BACKUP_FORMATS]
+        backupFormat = config.conf["browserHistoryRemover"]["backupFormat"]
+        self.backupFormatCombo.SetSelection(backupFormats.index(backupFormat) if backupFormat in backupFormats else 0)
+        self.keepCountSpin.SetValue(config.conf["browserHistoryRemover"]["backupKeepCount"])
+        self.maxAgeSpin.SetValue(config.conf["browserHistoryRemover"]["backupMaxAgeDays"])
+        self.quotaSpin.SetValue(config.conf["browserHistoryRemover"]["backupQuotaMB"])
+        defaultBrowser = config.conf["browserHistoryRemover"]["defaultBrowser"]
+        if defaultBrowser in BROWSERS:
+            self.defaultBrowserCombo.SetSelection(BROWSERS.index(defaultBrowser))
+        else:
+            self.defaultBrowserCombo.SetSelection(0)
+        self.updateNoteText()
+
+    def onKeyDown(self, evt):
+        keyCode = evt.GetKeyCode()
+
+        if keyCode == wx.WXK_ESCAPE:
+            self.onCancel(None)
+            return
+
+        evt.Skip()
+
+    def onSave(self, evt):
+        config.conf["browserHistoryRemover"]["copyHistoryBeforeDeletion"] = self.copyHistoryCheckBox.GetValue()
+        config.conf["browserHistoryRemover"]["instantRemoval"] = self.instantRemovalCheckBox.GetValue()
+        config.conf["browserHistoryRemover"]["secureOverwrite"] = self.secureOverwriteCheckBox.GetValue()
+        config.conf["browserHistoryRemover"]["autoClearOnExit"] = self.autoClearCheckBox.GetValue()
+        config.conf["browserHistoryRemover"]["profileOperations"] = self.profileOperationsCheckBox.GetValue()
+        purgeRangeSelection = self.purgeRangeCombo.GetSelection()
+        if purgeRangeSelection != wx.NOT_FOUND:
+            config.conf["browserHistoryRemover"]["purgeRange"] = PURGE_RANGE_CHOICES[purgeRangeSelection][0]
+        backupFormatSelection = self.backupFormatCombo.GetSelection()
+        if backupFormatSelection != wx.NOT_FOUND:
+            config.conf["browserHistoryRemover"]["backupFormat"] = BACKUP_FORMATS[backupFormatSelection][0]
+        config.conf["browserHistoryRemover"]["backupKeepCount"] = self.keepCountSpin.GetValue()
+        config.conf["browserHistoryRemover"]["backupMaxAgeDays"] = self.maxAgeSpin.GetValue()
+        config.conf["browserHistoryRemover"]["backupQuotaMB"] = self.quotaSpin.GetValue()
+        selection = self.defaultBrowserCombo.GetSelection()
+        if selection != wx.NOT_FOUND:
+            config.conf["browserHistoryRemover"]["defaultBrowser"] = BROWSERS[selection]
+        self.EndModal(wx.ID_OK)
+
+    def onCancel(self, evt):
+        self.EndModal(wx.ID_CANCEL)
+
+
+class BrowserHistoryRemoverDialog(wx.Dialog):
+    def __init__(self, parent):
+        super().__init__(parent, title=_("Browser History Remover"), size=(500, 400))
+        self.job = None
+        self.lastAnnouncement = 0.0
+        self.Centre()
+        self.initUI()
+        self.Bind(wx.EVT_CHAR_HOOK, self.onKeyDown)
+        self.browsersList.SetFocus()
+
+    def initUI(self):
+        mainSizer = wx.BoxSizer(wx.VERTICAL)
+        sHelper = gui.guiHelper.BoxSizerHelper(self, orientation=wx.VERTICAL)
+
+        browsersLabel = wx.StaticText(self, label=_("Select browser:"))
+        sHelper.addItem(browsersLabel)
+
+        self.browsersList = wx.ListBox(self, choices=BROWSERS, style=wx.LB_SINGLE)
+        self.browsersList.SetSelection(0)
+        sHelper.addItem(self.browsersList, proportion=1, flag=wx.EXPAND)
+
+        self.statusText = sHelper.addItem(wx.StaticText(self, label=""), flag=wx.EXPAND)
+
+        buttonSizer = wx.BoxSizer(wx.HORIZONTAL)
+
+        self.deleteButton = wx.Button(self, label=_("&Delete History"))
+        self.deleteButton.Bind(wx.EVT_BUTTON, self.onDeleteHistory)
+        buttonSizer.Add(self.deleteButton, flag=wx.RIGHT, border=10)
+
+        self.restoreButton = wx.Button(self, label=_("&Restore History"))
+        self.restoreButton.Bind(wx.EVT_BUTTON, self.onRestoreHistory)
+        buttonSizer.Add(self.restoreButton, flag=wx.RIGHT, border=10)
+
+        self.clearAllButton = wx.Button(self, label=_("Clear A&ll Browsers"))
+        self.clearAllButton.Bind(wx.EVT_BUTTON, self.onClearAll)
+        buttonSizer.Add(self.clearAllButton, flag=wx.RIGHT, border=10)
+
+        self.configButton = wx.Button(self, label=_("&Configurations"))
+        self.configButton.Bind(wx.EVT_BUTTON, self.onConfigurations)
+        buttonSizer.Add(self.configButton, flag=wx.RIGHT, border=10)
+
+        self.cancelJobButton = wx.Button(self, label=_("C&ancel Operation"))
+        self.cancelJobButton.Bind(wx.EVT_BUTTON, self.onCancelJob)
+        self.cancelJobButton.Disable()
+        buttonSizer.Add(self.cancelJobButton, flag=wx.RIGHT, border=10)
+
+        self.exitButton = wx.Button(self, wx.ID_CANCEL, label=_("E&xit"))
+        self.exitButton.Bind(wx.EVT_BUTTON, self.onExit)
+        buttonSizer.Add(self.exitButton)
+
+        sHelper.addItem(buttonSizer)
+
+        mainSizer.Add(sHelper.sizer, border=10, flag=wx.ALL | wx.EXPAND, proportion=1)
+        self.SetSizer(mainSizer)
+
+    def onKeyDown(self, evt):
+        keyCode = evt.GetKeyCode()
+        modifiers = evt.GetModifiers()
+
+        if keyCode == wx.WXK_ESCAPE:
+            self.onExit(None)
+            return
+
+        if modifiers == wx.MOD_CONTROL:
+            if keyCode in (ord('Q'), ord('q')):
+                self.onExit(None)
+                return
+            if keyCode in (ord('F'), ord('f')):
+                self.browsersList.SetFocus()
+                return
+
+        if modifiers == wx.MOD_ALT:
+            if keyCode in (ord('D'), ord('d')):
+                self.onDeleteHistory(None)
+                return
+            if keyCode in (ord('R'), ord('r')):
+                self.onRestoreHistory(None)
+                return
+            if keyCode in (ord('C'), ord('c')):
+                self.onConfigurations(None)
+                return
+            if keyCode in (ord('L'), ord('l')):
+                self.onClearAll(None)
+                return
+            if keyCode in (ord('A'), ord('a')):
+                self.onCancelJob(None)
+                return
+
+        evt.Skip()
+
+    def onExit(self, evt):
+        if self.job:
+            self.job.cancel()
+        self.EndModal(wx.ID_CANCEL)
+
+    def isBusy(self):
+        if self.job:
+            ui.message(_("An operation is already in progress."))
+            return True
+        return False
+
+    def startJob(self, operation, browser, target, onDone, metrics=None):
+        self.job = Job(
+            lambda progress: runRecorded(operation, browser, target, progress),
+            onProgress=self.onJobProgress,
+            onDone=lambda result: self.onJobDone(onDone, result),
+            metrics=metrics
+        )
+        self.lastAnnouncement = time.monotonic()
+        for button in (self.deleteButton, self.restoreButton, self.clearAllButton, self.configButton):
+            button.Disable()
+        self.cancelJobButton.Enable()
+        self.job.start()
+
+    def onJobProgress(self, phase, files, bytes):
+        if not self or not self.job:
+            return
+        status = _("{phase}: {files} files, {size}").format(phase=phase, files=files, size=formatSize(bytes))
+        self.statusText.SetLabel(status)
+        now = time.monotonic()
+        if now - self.lastAnnouncement >= PROGRESS_ANNOUNCE_INTERVAL:
+            self.lastAnnouncement = now
+            ui.message(status)
+
+    def onJobDone(self, onDone, result):
+        if not self:
+            return
+        self.job = None
+        self.statusText.SetLabel("")
+        for button in (self.deleteButton, self.restoreButton, self.clearAllButton, self.configButton):
+            button.Enable()
+        self.cancelJobButton.Disable()
+        onDone(*result)
+
+    def onCancelJob(self, evt):
+        if self.job:
+            self.job.cancel()
+            ui.message(_("Cancelling"))
+
+    def onConfigurations(self, evt):
+        if self.isBusy():
+            return
+        configDialog = ConfigurationDialog(self)
+        configDialog.ShowModal()
+        configDialog.Destroy()
+
+    def onDeleteHistory(self, evt):
+        if self.isBusy():
+            return
+        selection = self.browsersList.GetSelection()
+        if selection == wx.NOT_FOUND:
+            gui.messageBox(
+                _("No browser selected."),
+                _("Error"),
+                wx.OK | wx.ICON_ERROR,
+                self
+            )
+            return
+
+        selected_browser = BROWSERS[selection]
+
+        if not isBrowserInstalled(selected_browser):
+            gui.messageBox(
+                _("Sorry, {browser} is not installed in your system.").format(browser=selected_browser),
+                _("Browser Not Found"),
+                wx.OK | wx.ICON_ERROR,
+                self
+            )
+            return
+
+        metrics = OperationMetrics()
+        with metrics.phase("processCheck"):
+            running_pids = getBrowserProcesses(selected_browser)
+        if running_pids:
+            gui.messageBox(
+                _("Please exit {browser} before removing history.\n\nProcesses still running: {pids}").format(
+                    browser=selected_browser,
+                    pids=", ".join(str(pid) for pid in running_pids)
+                ),
+                _("Browser Running"),
+                wx.OK | wx.ICON_WARNING,
+                self
+            )
+            return
+
+        self.startJob(
+            "plan",
+            selected_browser,
+            lambda progress: planHistoryRemoval(selected_browser, progress),
+            lambda success, result: self.onPlanReady(selected_browser, success, result),
+            metrics
+        )
+
+    def onPlanReady(self, selected_browser, success, result):
+        if not success:
+            gui.messageBox(
+                _("Failed to scan history for {browser}.\n\nReason: {error}").format(
+                    browser=selected_browser,
+                    error=result
+                ),
+                _("Error"),
+                wx.OK | wx.ICON_ERROR,
+                self
+            )
+            return
+
+        if not result.targets:
+            gui.messageBox(
+                _("There is no browsing history to remove for {browser}.").format(browser=selected_browser),
+                _("Nothing to Remove"),
+                wx.OK | wx.ICON_INFORMATION,
+                self
+            )
+            return
+
+        confirm = gui.messageBox(
+            describePlan(result),
+            _("Confirm Deletion"),
+            wx.YES_NO | wx.ICON_QUESTION,
+            self
+        )
+
+        if confirm == wx.NO:
+            return
+
+        self.startJob(
+            "delete",
+            selected_browser,
+            lambda progress: self.deleteBrowserHistory(selected_browser, progress, result),
+            lambda success, error_message: self.onDeleteDone(selected_browser, success, error_message)
+        )
+
+    def onDeleteDone(self, selected_browser, success, error_message):
+        if success:
+            gui.messageBox(
+                _("History for {browser} has been deleted successfully.").format(browser=selected_browser),
+                _("Success"),
+                wx.OK | wx.ICON_INFORMATION,
+                self
+            )
+        else:
+            gui.messageBox(
+                _("Failed to delete history for {browser}.\n\nReason: {error}").format(
+                    browser=selected_browser,
+                    error=error_message
+                ),
+                _("Error"),
+                wx.OK | wx.ICON_ERROR,
+                self
+            )
+
+    def onClearAll(self, evt):
+        if self.isBusy():
+            return
+
+        metrics = OperationMetrics()
+        with metrics.phase("processCheck"):
+            browsers, running = getBatchBrowsers()
+        if not browsers:
+            if running:
+                message = _("All installed browsers are running. Please exit them before removing history.\n\nRunning: {browsers}").format(
+                    browsers=", ".join(running)
+                )
+            else:
+                message = _("No supported browsers are installed in your system.")
+            gui.messageBox(message, _("Nothing to Remove"), wx.OK | wx.ICON_INFORMATION, self)
+            return
+
+        confirmText = _("Clear browsing history for all of these browsers at the same time?\n\n{browsers}").format(
+            browsers=", ".join(browsers)
+        )
+        if running:
+            confirmText += "\n\n" + _("These browsers are running and will be skipped: {browsers}").format(
+                browsers=", ".join(running)
+            )
+        if config.conf["browserHistoryRemover"]["purgeRange"] != "files":
+            confirmText += "\n\n" + _("Time range: {range}").format(range=getPurgeRangeLabel())
+
+        confirm = gui.messageBox(
+            confirmText,
+            _("Confirm Deletion"),
+            wx.YES_NO | wx.ICON_QUESTION,
+            self
+        )
+
+        if confirm == wx.NO:
+            return
+
+        self.startJob(
+            "clearAll",
+            None,
+            lambda progress: clearAllBrowsers(browsers, running, progress),
+            self.onClearAllDone,
+            metrics
+        )
+
+    def onClearAllDone(self, success, summary):
+        gui.messageBox(
+            summary,
+            _("Success") if success else _("Error"),
+            wx.OK | (wx.ICON_INFORMATION if success else wx.ICON_ERROR),
+            self
+        )
+
+    def onRestoreHistory(self, evt):
+        if self.isBusy():
+            return
+        selection = self.browsersList.GetSelection()
+        if selection == wx.NOT_FOUND:
+            gui.messageBox(
+                _("No browser selected."),
+                _("Error"),
+                wx.OK | wx.ICON_ERROR,
+                self
+            )
+            return
+
+        selected_browser = BROWSERS[selection]
+
+        if not isBrowserInstalled(selected_browser):
+            gui.messageBox(
+                _("Sorry, {browser} is not installed in your system.").format(browser=selected_browser),
+                _("Browser Not Found"),
+                wx.OK | wx.ICON_ERROR,
+                self
+            )
+            return
+
+        metrics = OperationMetrics()
+        with metrics.phase("processCheck"):
+            running_pids = getBrowserProcesses(selected_browser)
+        if running_pids:
+            gui.messageBox(
+                _("Please exit {browser} before restoring history.\n\nProcesses still running: {pids}").format(
+                    browser=selected_browser,
+                    pids=", ".join(str(pid) for pid in running_pids)
+                ),
+                _("Browser Running"),
+                wx.OK | wx.ICON_WARNING,
+                self
+            )
+            return
+
+        backup_base_path = getBackupBasePath(selected_browser)
+        initial_path = backup_base_path if os.path.exists(backup_base_path) else os.path.expanduser("~")
+
+        has_folders, has_archives = findBackupKinds(selected_browser)
+        if has_folders and has_archives:
+            kindDialog = wx.SingleChoiceDialog(
+                self,
+                _("Backups for {browser} are stored both as folders and as archive files. Which kind do you want to restore from?").format(
+                    browser=selected_browser
+                ),
+                _("Backup Type"),
+                [_("Backup folder"), _("Backup archive file")]
+            )
+            kindDialog.SetSelection(1 if config.conf["browserHistoryRemover"]["backupFormat"] == "archive" else 0)
+            if kindDialog.ShowModal() != wx.ID_OK:
+                kindDialog.Destroy()
+                return
+            from_archive = kindDialog.GetSelection() == 1
+            kindDialog.Destroy()
+        elif has_folders or has_archives:
+            from_archive = has_archives
+        else:
+            from_archive = config.conf["browserHistoryRemover"]["backupFormat"] == "archive"
+
+        if from_archive:
+            pathDialog = wx.FileDialog(
+                self,
+                _("Select backup archive containing history for {browser}").format(browser=selected_browser),
+                defaultDir=initial_path,
+                wildcard=_("Backup archives (*{ext})|*{ext}").format(ext=ARCHIVE_EXTENSION),
+                style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST
+            )
+        else:
+            pathDialog = wx.DirDialog(
+                self,
+                _("Select backup folder containing history for {browser}").format(browser=selected_browser),
+                defaultPath=initial_path,
+                style=wx.DD_DEFAULT_STYLE | wx.DD_DIR_MUST_EXIST
+            )
+
+        if pathDialog.ShowModal() != wx.ID_OK:
+            pathDialog.Destroy()
+            return
+
+        backup_path = pathDialog.GetPath()
+        pathDialog.Destroy()
+
+        if not backup_path:
+            gui.messageBox(
+                _("No folder selected."),
+                _("Error"),
+                wx.OK | wx.ICON_ERROR,
+                self
+            )
+            return
+
+        if not os.path.exists(backup_path):
+            gui.messageBox(
+                _("Selected folder does not exist."),
+                _("Error"),
+                wx.OK | wx.ICON_ERROR,
+                self
+            )
+            return
+
+        if os.path.isdir(backup_path) and not os.listdir(backup_path):
+            gui.messageBox(
+                _("Selected folder is empty."),
+                _("Error"),
+                wx.OK | wx.ICON_ERROR,
+                self
+            )
+            return
+
+        browser_path = getBrowserPath(selected_browser)
+        if not browser_path:
+            gui.messageBox(
+                _("Could not determine browser data path for {browser}.").format(browser=selected_browser),
+                _("Error"),
+                wx.OK | wx.ICON_ERROR,
+                self
+            )
+            return
+
+        confirm = gui.messageBox(
+            _("This will replace the current history data for {browser} with the backup from:\n{path}\n\nCurrent history data will be deleted. Continue?").format(
+                browser=selected_browser,
+                path=backup_path
+            ),
+            _("Confirm Restore"),
+            wx.YES_NO | wx.ICON_QUESTION,
+            self
+        )
+
+        if confirm == wx.NO:
+            return
+
+        self.startJob(
+            "restore",
+            selected_browser,
+            lambda progress: restoreHistoryFiles(backup_path, browser_path, selected_browser, progress),
+            lambda success, message: self.onRestoreDone(selected_browser, success, message),
+            metrics
+        )
+
+    def onRestoreDone(self, selected_browser, success, message):
+        if success:
+            gui.messageBox(
+                _("History for {browser} has been restored successfully.\n\n{details}").format(
+                    browser=selected_browser,
+                    details=message
+                ),
+                _("Success"),
+                wx.OK | wx.ICON_INFORMATION,
+                self
+            )
+        else:
+            gui.messageBox(
+                _("Failed to restore history for {browser}.\n\nReason: {error}").format(
+                    browser=selected_browser,
+                    error=message
+                ),
+                _("Error"),
+                wx.OK | wx.ICON_ERROR,
+                self
+            )
+
+    def deleteBrowserHistory(self, browser, progress=None, plan=None):
+        try:
+            browser_path = getBrowserPath(browser)
+
+            if not browser_path or not os.path.exists(browser_path):
+                return False, _("Browser data path not found.")
+
+            if progress is None:
+                progress = JobProgress()
+
+            if config.conf["browserHistoryRemover"]["copyHistoryBeforeDeletion"]:
+                progress.setPhase(_("Backing up"))
+                copy_success, copy_result = copyHistoryFiles(browser_path, browser, progress, plan)
+                if not copy_success:
+                    return False, _("Failed to backup history: {}").format(copy_result)
+
+            progress.setPhase(_("Deleting"))
+            delete_success, delete_result = clearHistory(browser_path, browser, progress, plan)
+            if not delete_success:
+                return False, delete_result
+
+            return True, ""
+
+        except Exception as e:
+            logging.error("Error deleting history for {}: {}".format(browser, str(e)))
+            return False, str(e)
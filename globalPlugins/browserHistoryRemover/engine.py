@@ -0,0 +1,923 @@
+import addonHandler
+import os
+import shutil
+import logging
+import time
+import config
+import globalVars
+from datetime import datetime
+from .browsers import BROWSERS, BROWSER_PROCESSES, getBrowserPath, isBrowserInstalled
+from .fileWalker import expandFiles
+from .targetRules import BACKUP_EXCLUDED_CATEGORIES, SHRED_CATEGORIES, getTargetRules
+from .planner import buildPlan
+from .scanIndex import ScanIndex
+from .batch import BatchRunner, runAlongside
+from .profileDiscovery import profileIndex
+from .deletionEngine import DeletionEngine
+from .shredder import Shredder
+from .trash import createTrashDir, moveToTrash, reaper
+from .processIndex import processIndex
+from .progress import JobProgress, trackTargets
+from .jobs import formatSize
+from .metrics import MetricsLog
+from .journal import JOURNAL_DIR, OperationJournal, PathEntry, findJournals, readJournal, startJournal
+from .retention import BackupRetention, RetentionPolicy
+from .backupStore import BackupStore, copyWithDigest, hashFile, isObjectStore
+from .snapshotManifest import manifestEntry, writeManifest, readManifest
+from .restoreTransaction import RestoreTransaction, isSameVolume
+from .sqlitePurge import classifyDatabase, getCutoff, purgeDatabase
+from .sqliteSnapshot import isSqliteDatabase, isDatabaseSidecar, databaseSignature, snapshotDatabase
+from .backupArchive import ARCHIVE_EXTENSION, ArchiveWriter, isBackupArchive, archiveHasFiles, extractArchive
+
+addonHandler.initTranslation()
+
+SCAN_INDEX_FILE = "scanIndex.json"
+ERROR_LOG_FILE = "errors.log"
+
+BACKUP_FORMATS = [
+    ("deduplicated", _("Deduplicated (unchanged files share storage)")),
+    ("folder", _("Plain copies")),
+    ("archive", _("Compressed archive (one zip file per backup)")),
+]
+
+PURGE_RANGE_CHOICES = [
+    ("files", _("Everything, by deleting the history files")),
+    ("all", _("Everything, keeping the history databases")),
+    ("hour", _("Last hour")),
+    ("day", _("Last 24 hours")),
+    ("week", _("Last 7 days")),
+]
+
+CATEGORY_LABELS = {
+    "history": _("History"),
+    "formData": _("Form data"),
+    "downloads": _("Downloads"),
+    "cookies": _("Cookies"),
+    "logins": _("Saved logins"),
+    "favicons": _("Site icons"),
+    "session": _("Sessions and tabs"),
+    "cache": _("Cache"),
+    "storage": _("Site storage"),
+    "sync": _("Sync data"),
+}
+
+def getAddonDataPath():
+    return os.path.join(globalVars.appArgs.configPath, "browserHistoryRemover")
+
+
+try:
+    os.makedirs(getAddonDataPath(), exist_ok=True)
+    logging.basicConfig(level=logging.ERROR, filename=os.path.join(getAddonDataPath(), ERROR_LOG_FILE))
+except OSError:
+    pass
+
+def getJournalPath():
+    return os.path.join(getAddonDataPath(), JOURNAL_DIR)
+
+
+scanIndex = ScanIndex(os.path.join(getAddonDataPath(), SCAN_INDEX_FILE))
+metricsLog = MetricsLog(getAddonDataPath())
+
+
+def runRecorded(operation, browser, target, progress):
+    result = None
+    start = time.perf_counter()
+    try:
+        with metricsLog.profile(operation, config.conf["browserHistoryRemover"]["profileOperations"]):
+            result = target(progress)
+    finally:
+        record = progress.metrics.asRecord(operation, browser, result)
+        record["seconds"] = round(time.perf_counter() - start, 4)
+        record["cancelled"] = progress.cancelled
+        metricsLog.write(record)
+    return result
+
+
+def getBrowserProcesses(browser):
+    return processIndex.findPids(BROWSER_PROCESSES.get(browser, ()))
+
+
+def isBrowserRunning(browser):
+    return bool(getBrowserProcesses(browser))
+
+
+def getRunningBrowsers():
+    snapshot = processIndex.snapshot()
+    running = {}
+    for browser in BROWSERS:
+        pids = snapshot.findPids(BROWSER_PROCESSES.get(browser, ()))
+        if pids:
+            running[browser] = pids
+    return running
+
+
+def getBackupPath(browser):
+    user_profile = os.path.expanduser("~")
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    backup_path = os.path.join(user_profile, "Downloads", "browser_history_remover", "history", browser, timestamp)
+    return backup_path
+
+
+def getBackupBasePath(browser):
+    user_profile = os.path.expanduser("~")
+    backup_path = os.path.join(user_profile, "Downloads", "browser_history_remover", "history", browser)
+    return backup_path
+
+
+def findBackupKinds(browser):
+    has_folders = False
+    has_archives = False
+    try:
+        with os.scandir(getBackupBasePath(browser)) as scanner:
+            for entry in scanner:
+                if entry.is_dir(follow_symlinks=False):
+                    has_folders = has_folders or not isObjectStore(entry.path)
+                elif entry.name.lower().endswith(ARCHIVE_EXTENSION):
+                    has_archives = True
+    except OSError:
+        pass
+    return has_folders, has_archives
+
+
+def scanBackupSources(profile_path, browser):
+    return expandFiles(getTargetRules(browser).scanPaths(
+        profileIndex.getDataPaths(profile_path, includeExternal=False),
+        excluded=BACKUP_EXCLUDED_CATEGORIES
+    ))
+
+
+def scanHistoryTargets(profile_path, browser):
+    return getTargetRules(browser).scanPaths(profileIndex.getDataPaths(profile_path, includeCache=True))
+
+
+def copyHistoryFiles(profile_path, browser, progress=None, plan=None):
+    if not os.path.exists(profile_path):
+        return False, _("Profile path does not exist.")
+
+    if progress is None:
+        progress = JobProgress()
+
+    backup_format = config.conf["browserHistoryRemover"]["backupFormat"]
+    backup_path = getBackupPath(browser)
+    sources = plan.backupFiles if plan else scanBackupSources(profile_path, browser)
+
+    if backup_format == "archive":
+        with progress.metrics.phase("backup"):
+            result = copyHistoryArchive(profile_path, sources, backup_path + ARCHIVE_EXTENSION, progress)
+        if result[0]:
+            pruneBackups(browser, progress)
+        return result
+
+    try:
+        os.makedirs(backup_path, exist_ok=True)
+    except Exception as e:
+        return False, _("Failed to create backup directory: {}").format(str(e))
+
+    store = None
+    if backup_format == "deduplicated":
+        store = BackupStore(getBackupBasePath(browser))
+
+    copied_count = 0
+    failed_count = 0
+    manifest_entries = []
+    created_dirs = set()
+
+    with progress.metrics.phase("backup"):
+        for entry, category in sources:
+            if progress.cancelled:
+                shutil.rmtree(backup_path, ignore_errors=True)
+                return False, _("Operation cancelled.")
+            src_path = entry.path
+            if isDatabaseSidecar(src_path):
+                continue
+            try:
+                src_stat = entry.stat()
+                relative_path = os.path.relpath(src_path, profile_path)
+                dest_path = os.path.join(backup_path, relative_path)
+                dest_dir = os.path.dirname(dest_path)
+                if dest_dir not in created_dirs:
+                    os.makedirs(dest_dir, exist_ok=True)
+                    created_dirs.add(dest_dir)
+                if isSqliteDatabase(src_path):
+                    if store:
+                        digest, size = store.addFile(
+                            src_path, relative_path, src_stat, dest_path,
+                            signature=databaseSignature(src_path, src_stat),
+                            snapshot=snapshotDatabase
+                        )
+                    else:
+                        snapshotDatabase(src_path, dest_path)
+                        digest, size = hashFile(dest_path)
+                        os.utime(dest_path, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+                elif store:
+                    digest, size = store.addFile(src_path, relative_path, src_stat, dest_path)
+                else:
+                    digest, size = copyWithDigest(src_path, dest_path)
+                    os.utime(dest_path, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+                manifest_entries.append(manifestEntry(relative_path, size, src_stat.st_mtime_ns, digest))
+                copied_count += 1
+                progress.advance(bytes=size)
+                progress.metrics.count("filesBackedUp")
+                progress.metrics.count("bytesBackedUp", size)
+            except Exception as e:
+                logging.error("Error backing up {}: {}".format(src_path, str(e)))
+                progress.metrics.addError(e)
+                failed_count += 1
+
+    if store:
+        try:
+            store.save()
+        except Exception as e:
+            logging.error("Error saving backup index for {}: {}".format(browser, str(e)))
+
+    if copied_count == 0 and failed_count > 0:
+        return False, _("Failed to copy any files.")
+
+    try:
+        writeManifest(backup_path, manifest_entries)
+    except Exception as e:
+        logging.error("Error writing backup manifest for {}: {}".format(browser, str(e)))
+
+    pruneBackups(browser, progress)
+    return True, backup_path
+
+
+def getRetentionPolicy():
+    conf = config.conf["browserHistoryRemover"]
+    return RetentionPolicy(
+        keepCount=conf["backupKeepCount"],
+        maxAgeDays=conf["backupMaxAgeDays"],
+        quotaBytes=conf["backupQuotaMB"] * 1024 * 1024
+    )
+
+
+def pruneBackups(browser, progress):
+    policy = getRetentionPolicy()
+    if not policy.enabled:
+        return
+    with progress.metrics.phase("retention"):
+        try:
+            removed, freed = BackupRetention(getBackupBasePath(browser)).prune(policy)
+        except Exception as e:
+            logging.error("Error removing old backups for {}: {}".format(browser, str(e)))
+            progress.metrics.addError(e)
+            return
+    progress.metrics.count("backupsRemoved", removed)
+    progress.metrics.count("backupBytesFreed", freed)
+
+
+def copyHistoryArchive(profile_path, sources, archive_path, progress):
+    try:
+        os.makedirs(os.path.dirname(archive_path), exist_ok=True)
+        writer = ArchiveWriter(archive_path)
+    except Exception as e:
+        return False, _("Failed to create backup archive: {}").format(str(e))
+
+    copied_count = 0
+    failed_count = 0
+
+    try:
+        for entry, category in sources:
+            if progress.cancelled:
+                writer.discard()
+                return False, _("Operation cancelled.")
+            if isDatabaseSidecar(entry.path):
+                continue
+            try:
+                size = writer.addFile(
+                    entry.path,
+                    os.path.relpath(entry.path, profile_path),
+                    snapshotDatabase if isSqliteDatabase(entry.path) else None
+                )
+                copied_count += 1
+                progress.advance(bytes=size)
+                progress.metrics.count("filesBackedUp")
+                progress.metrics.count("bytesBackedUp", size)
+            except Exception as e:
+                logging.error("Error backing up {}: {}".format(entry.path, str(e)))
+                progress.metrics.addError(e)
+                failed_count += 1
+
+        if copied_count == 0 and failed_count > 0:
+            writer.discard()
+            return False, _("Failed to copy any files.")
+
+        writer.commit()
+    except Exception as e:
+        writer.discard()
+        return False, _("Failed to write backup archive: {}").format(str(e))
+
+    return True, archive_path
+
+
+def removeMatchingEntries(targets, progress, journal=None):
+    engine = DeletionEngine(
+        workers=config.conf["browserHistoryRemover"]["deletionWorkers"],
+        onError=progress.metrics.addError,
+        onRemoved=journal.markDone if journal else None
+    )
+    return engine.removeTargets(trackTargets(targets, progress))
+
+
+def trashMatchingEntries(profile_path, targets, progress, journal=None):
+    try:
+        trash_path = createTrashDir(profile_path)
+    except OSError as e:
+        progress.metrics.addError(e)
+        return removeMatchingEntries(targets, progress, journal)
+
+    moved_files, moved_dirs, leftovers = moveToTrash(trackTargets(targets, progress), trash_path)
+    reaper.reap(trash_path)
+
+    if leftovers:
+        engine = DeletionEngine(
+            workers=config.conf["browserHistoryRemover"]["deletionWorkers"],
+            onError=progress.metrics.addError,
+            onRemoved=journal.markDone if journal else None
+        )
+        removed_files, removed_dirs = engine.removeTargets(leftovers)
+        moved_files += removed_files
+        moved_dirs += removed_dirs
+
+    return moved_files, moved_dirs
+
+
+def shredSensitiveEntries(targets, progress):
+    sensitive = []
+    remaining = []
+    for entry, category in targets:
+        if category in SHRED_CATEGORIES:
+            sensitive.append((entry, category))
+        else:
+            remaining.append((entry, category))
+
+    shredder = Shredder(
+        workers=config.conf["browserHistoryRemover"]["deletionWorkers"],
+        onError=progress.metrics.addError
+    )
+    with progress.metrics.phase("shred"):
+        shredded_files, unshredded_files, shredded_dirs, shredded_bytes = shredder.shredTargets(trackTargets(sensitive, progress))
+    progress.metrics.count("filesShredded", shredded_files)
+    progress.metrics.count("filesNotShredded", unshredded_files)
+    progress.metrics.count("bytesShredded", shredded_bytes)
+    return remaining, shredded_files, unshredded_files, shredded_dirs
+
+
+def removeHistoryTargets(profile_path, targets, deferred, secure, progress, journal):
+    shredded_files = unshredded_files = shredded_dirs = 0
+    if secure:
+        targets, shredded_files, unshredded_files, shredded_dirs = shredSensitiveEntries(targets, progress)
+    with progress.metrics.phase("delete"):
+        if deferred:
+            deleted_files, deleted_dirs = trashMatchingEntries(profile_path, targets, progress, journal)
+        else:
+            deleted_files, deleted_dirs = removeMatchingEntries(targets, progress, journal)
+    deleted_files += shredded_files + unshredded_files
+    deleted_dirs += shredded_dirs
+    progress.metrics.count("filesRemoved", deleted_files)
+    progress.metrics.count("dirsRemoved", deleted_dirs)
+    return deleted_files, deleted_dirs, unshredded_files
+
+
+def describeUnshredded(message, unshredded_files):
+    if not unshredded_files:
+        return message
+    return message + " " + _("{} files could not be overwritten and were deleted without overwriting.").format(unshredded_files)
+
+
+def deleteHistoryFiles(profile_path, browser, deferred=False, progress=None, plan=None):
+    if not os.path.exists(profile_path):
+        return False, _("Profile path does not exist.")
+
+    if progress is None:
+        progress = JobProgress()
+
+    targets = list(plan.targets if plan else scanHistoryTargets(profile_path, browser))
+    secure = config.conf["browserHistoryRemover"]["secureOverwrite"]
+    journal = startJournal(
+        getJournalPath(),
+        "delete",
+        browser=browser,
+        profile=profile_path,
+        deferred=deferred,
+        secure=secure,
+        targets=[[entry.path, category] for entry, category in targets]
+    )
+    try:
+        deleted_files, deleted_dirs, unshredded_files = removeHistoryTargets(profile_path, targets, deferred, secure, progress, journal)
+    except Exception:
+        journal.close()
+        raise
+    journal.complete()
+
+    if progress.cancelled:
+        return False, describeUnshredded(
+            _("Operation cancelled. Deleted {} files and {} directories.").format(deleted_files, deleted_dirs),
+            unshredded_files
+        )
+
+    return True, describeUnshredded(_("Deleted {} files and {} directories.").format(deleted_files, deleted_dirs), unshredded_files)
+
+
+def stageBackupFolder(backup_path, transaction, progress, move):
+    copied_count = 0
+    failed_count = 0
+    failed_files = []
+
+    for root, dirs, files in os.walk(backup_path):
+        for file in files:
+            if progress.cancelled:
+                return copied_count, failed_count, failed_files
+            try:
+                src_path = os.path.join(root, file)
+                digest, size = transaction.stageFile(src_path, os.path.relpath(src_path, backup_path), move)
+                copied_count += 1
+                progress.advance(bytes=size)
+            except Exception as e:
+                progress.metrics.addError(e)
+                failed_count += 1
+                failed_files.append(file)
+
+    return copied_count, failed_count, failed_files
+
+
+def stageFromManifest(backup_path, manifest_entries, transaction, progress, move):
+    copied_count = 0
+    failed_count = 0
+    failed_files = []
+
+    for item in manifest_entries:
+        if progress.cancelled:
+            break
+        try:
+            src_path = os.path.join(backup_path, *item["path"].split("/"))
+            digest, size = transaction.stageFile(src_path, item["path"], move, item["mtime"])
+            if size != item["size"] or (digest is not None and digest != item["sha256"]):
+                transaction.unstageFile(src_path, item["path"])
+                raise ValueError("Checksum mismatch")
+            copied_count += 1
+            progress.advance(bytes=size)
+        except Exception as e:
+            progress.metrics.addError(e)
+            failed_count += 1
+            failed_files.append(os.path.basename(item.get("path", "")))
+
+    return copied_count, failed_count, failed_files
+
+
+def purgeHistoryDatabases(profile_path, browser, range_key, progress=None, plan=None):
+    if not os.path.exists(profile_path):
+        return False, _("Profile path does not exist.")
+
+    if progress is None:
+        progress = JobProgress()
+
+    cutoff = getCutoff(range_key)
+    purged_databases = 0
+    deleted_rows = 0
+    failed_databases = 0
+
+    if plan:
+        targets = plan.targets
+    else:
+        targets = getTargetRules(browser).scanPaths(profileIndex.getDataPaths(profile_path))
+
+    for entry, category in targets:
+        if progress.cancelled:
+            break
+        name = classifyDatabase(entry.name)
+        if not name:
+            continue
+        try:
+            with progress.metrics.phase("purge"):
+                rows = purgeDatabase(entry.path, name, cutoff, progress)
+            deleted_rows += rows
+            purged_databases += 1
+            progress.advance()
+            progress.metrics.count("databasesPurged")
+            progress.metrics.count("rowsRemoved", rows)
+        except Exception as e:
+            logging.error("Error purging {}: {}".format(entry.path, str(e)))
+            progress.metrics.addError(e)
+            failed_databases += 1
+
+    if progress.cancelled:
+        return False, _("Operation cancelled. Removed {} entries.").format(deleted_rows)
+
+    if purged_databases == 0 and failed_databases > 0:
+        return False, _("Failed to open the history databases.")
+
+    return True, _("Removed {} entries from {} databases.").format(deleted_rows, purged_databases)
+
+
+def clearHistory(profile_path, browser, progress=None, plan=None):
+    range_key = config.conf["browserHistoryRemover"]["purgeRange"]
+    if range_key != "files":
+        return purgeHistoryDatabases(profile_path, browser, range_key, progress, plan)
+    return deleteHistoryFiles(
+        profile_path,
+        browser,
+        deferred=config.conf["browserHistoryRemover"]["instantRemoval"],
+        progress=progress,
+        plan=plan
+    )
+
+
+def planHistoryRemoval(browser, progress):
+    browser_path = getBrowserPath(browser)
+    if not browser_path or not os.path.exists(browser_path):
+        return False, _("Browser data path not found.")
+
+    progress.setPhase(_("Scanning"))
+    plan = buildPlan(browser_path, browser, progress, scanIndex)
+    if progress.cancelled:
+        return False, _("Operation cancelled.")
+    return True, plan
+
+
+def describePlan(plan):
+    if config.conf["browserHistoryRemover"]["purgeRange"] == "files":
+        lines = [
+            _("Delete all browsing history for {browser}?").format(browser=plan.browser),
+            "",
+            _("This will remove {files} files, {size} in total:").format(files=plan.files, size=formatSize(plan.bytes)),
+        ]
+        for category, (files, size) in sorted(plan.categories.items(), key=lambda item: item[1][1], reverse=True):
+            lines.append(_("{category}: {files} files, {size}").format(
+                category=CATEGORY_LABELS.get(category, category),
+                files=files,
+                size=formatSize(size)
+            ))
+    else:
+        databases = [entry for entry, category in plan.targets if classifyDatabase(entry.name)]
+        lines = [
+            _("Delete browsing history for {browser}?\n\nTime range: {range}").format(
+                browser=plan.browser,
+                range=getPurgeRangeLabel()
+            ),
+            "",
+            _("{count} history databases will be cleaned.").format(count=len(databases)),
+        ]
+    if config.conf["browserHistoryRemover"]["copyHistoryBeforeDeletion"]:
+        lines.append("")
+        lines.append(_("A backup of {files} files, {size} will be made first.").format(
+            files=len(plan.backupFiles),
+            size=formatSize(plan.backupBytes)
+        ))
+    return "\n".join(lines)
+
+
+def getBatchBrowsers():
+    running = getRunningBrowsers()
+    installed = [browser for browser in BROWSERS if isBrowserInstalled(browser)]
+    return [browser for browser in installed if browser not in running], [browser for browser in installed if browser in running]
+
+
+def clearBrowser(browser, progress, ioSlots):
+    browser_path = getBrowserPath(browser)
+    with ioSlots:
+        plan = buildPlan(
+            browser_path, browser, progress,
+            sizeTargets=False,
+            listBackup=config.conf["browserHistoryRemover"]["copyHistoryBeforeDeletion"]
+        )
+    if progress.cancelled:
+        return False, _("Operation cancelled.")
+    if not plan.targets:
+        return True, ""
+
+    if not config.conf["browserHistoryRemover"]["copyHistoryBeforeDeletion"]:
+        with ioSlots:
+            return clearHistory(browser_path, browser, progress, plan)
+
+    def backup():
+        with ioSlots:
+            return copyHistoryFiles(browser_path, browser, progress, plan)
+
+    if config.conf["browserHistoryRemover"]["purgeRange"] == "files":
+        unsaved = plan.select(BACKUP_EXCLUDED_CATEGORIES)
+        plan = plan.select(BACKUP_EXCLUDED_CATEGORIES, exclude=True)
+
+        def clearUnsaved():
+            with ioSlots:
+                return clearHistory(browser_path, browser, progress, unsaved)
+
+        (copy_success, copy_result), unsaved_result = runAlongside(clearUnsaved, backup)
+        if not unsaved_result[0]:
+            logging.error("Error clearing cache for {}: {}".format(browser, unsaved_result[1]))
+    else:
+        copy_success, copy_result = backup()
+
+    if not copy_success:
+        return False, _("Failed to backup history: {}").format(copy_result)
+
+    with ioSlots:
+        return clearHistory(browser_path, browser, progress, plan)
+
+
+def clearAllBrowsers(browsers, running, progress):
+    progress.setPhase(_("Clearing {count} browsers").format(count=len(browsers)))
+    results = BatchRunner().run(browsers, lambda browser, ioSlots: clearBrowser(browser, progress, ioSlots))
+
+    cleared = [browser for browser in browsers if results[browser][0]]
+    failed = [browser for browser in browsers if not results[browser][0]]
+    for browser in failed:
+        logging.error("Error clearing history for {}: {}".format(browser, results[browser][1]))
+
+    parts = []
+    if progress.cancelled:
+        parts.append(_("Operation cancelled."))
+    if cleared:
+        parts.append(_("History cleared for {count} browsers: {browsers}.").format(
+            count=len(cleared),
+            browsers=", ".join(cleared)
+        ))
+    if failed:
+        parts.append(_("Failed for {browsers}.").format(browsers=", ".join(failed)))
+    if running:
+        parts.append(_("Skipped because they are running: {browsers}.").format(browsers=", ".join(running)))
+    return not failed, " ".join(parts)
+
+
+def getPurgeRangeLabel():
+    range_key = config.conf["browserHistoryRemover"]["purgeRange"]
+    for key, label in PURGE_RANGE_CHOICES:
+        if key == range_key:
+            return label
+    return PURGE_RANGE_CHOICES[0][1]
+
+
+def stageBackup(backup_path, from_archive, manifest_entries, transaction, progress, move):
+    with progress.metrics.phase("restore"):
+        if from_archive:
+            return extractArchive(backup_path, transaction.staging_path, progress)
+        if manifest_entries is not None:
+            return stageFromManifest(backup_path, manifest_entries, transaction, progress, move)
+        return stageBackupFolder(backup_path, transaction, progress, move)
+
+
+def commitRestore(transaction, browser_path, browser, progress, journal):
+    with progress.metrics.phase("commit"):
+        transaction.commit(getTargetRules(browser).scanPaths(
+            profileIndex.getDataPaths(browser_path, includeExternal=False)
+        ), journal)
+    journal.record("committed")
+    journal.sync()
+
+
+def finishRestore(transaction, backup_path, from_archive, keepBackup=False):
+    transaction.finish()
+    if keepBackup:
+        return
+
+    try:
+        if from_archive:
+            os.remove(backup_path)
+        else:
+            shutil.rmtree(backup_path, ignore_errors=True)
+        parent_dir = os.path.dirname(backup_path)
+        if os.path.exists(parent_dir) and not os.listdir(parent_dir):
+            shutil.rmtree(parent_dir, ignore_errors=True)
+    except Exception:
+        pass
+
+
+def restoreHistoryFiles(backup_path, browser_path, browser, progress=None):
+    if not os.path.exists(backup_path):
+        return False, _("Selected backup path does not exist.")
+
+    if progress is None:
+        progress = JobProgress()
+
+    from_archive = isBackupArchive(backup_path)
+    manifest_entries = None
+
+    if from_archive:
+        if not archiveHasFiles(backup_path):
+            return False, _("Selected backup archive is empty or damaged.")
+    else:
+        if not os.path.isdir(backup_path):
+            return False, _("Selected path is not a directory.")
+
+        if isObjectStore(backup_path):
+            return False, _("Selected folder is the shared backup storage. Please select a dated backup folder.")
+
+        manifest_entries = readManifest(backup_path)
+        if manifest_entries is not None:
+            has_files = bool(manifest_entries)
+        else:
+            has_files = False
+            for root, dirs, files in os.walk(backup_path):
+                if files:
+                    has_files = True
+                    break
+
+        if not has_files:
+            return False, _("Selected backup folder is empty or contains no files.")
+
+    if not os.path.exists(browser_path):
+        try:
+            os.makedirs(browser_path, exist_ok=True)
+        except Exception as e:
+            return False, _("Failed to create browser data path: {}").format(str(e))
+
+    try:
+        transaction = RestoreTransaction(browser_path)
+    except Exception as e:
+        return False, _("Failed to prepare restore: {}").format(str(e))
+
+    move = not from_archive and isSameVolume(backup_path, transaction.staging_path)
+    journal = startJournal(
+        getJournalPath(),
+        "restore",
+        browser=browser,
+        browserPath=browser_path,
+        backup=backup_path,
+        staging=transaction.staging_path,
+        archive=from_archive,
+        move=move
+    )
+
+    progress.setPhase(_("Restoring"))
+    try:
+        copied_count, failed_count, failed_files = stageBackup(
+            backup_path, from_archive, manifest_entries, transaction, progress, move
+        )
+    except Exception as e:
+        transaction.discard()
+        journal.complete()
+        return False, _("Failed to restore history files: {}").format(str(e))
+
+    if progress.cancelled:
+        transaction.discard()
+        journal.complete()
+        return False, _("Operation cancelled. Existing browser data was not changed.")
+
+    if copied_count == 0:
+        transaction.discard()
+        journal.complete()
+        return False, _("No files were restored. Failed files: {}").format(", ".join(failed_files[:5]))
+
+    progress.metrics.count("filesRestored", copied_count)
+    progress.setPhase(_("Replacing existing data"))
+    try:
+        if failed_count > 0:
+            transaction.copyBorrowedBack()
+            journal.record("staged", failed=failed_count)
+        commitRestore(transaction, browser_path, browser, progress, journal)
+    except Exception as e:
+        transaction.discard()
+        journal.complete()
+        return False, _("Failed to replace existing browser data. The previous data was kept: {}").format(str(e))
+
+    finishRestore(transaction, backup_path, from_archive, keepBackup=failed_count > 0)
+    journal.complete()
+
+    if failed_count > 0:
+        return True, _("{} files restored successfully. {} files failed. The backup was kept.").format(copied_count, failed_count)
+
+    return True, _("{} files restored successfully.").format(copied_count)
+
+
+def resumeDelete(begin, records, journal, progress):
+    done = set(record.get("path") for record in records if record["type"] == "done")
+    targets = []
+    for path, category in begin["targets"]:
+        if path not in done and os.path.lexists(path):
+            targets.append((PathEntry(path), category))
+    deleted_files, deleted_dirs, unshredded_files = removeHistoryTargets(begin["profile"], targets, False, begin["secure"], progress, journal)
+    return True, describeUnshredded(
+        _("Finished removing the interrupted history deletion for {browser}. Deleted {files} files and {dirs} directories.").format(
+            browser=begin["browser"],
+            files=deleted_files,
+            dirs=deleted_dirs
+        ),
+        unshredded_files
+    )
+
+
+def resumeRestore(begin, records, journal, progress):
+    backup_path = begin["backup"]
+    transaction = RestoreTransaction(begin["browserPath"], begin["staging"])
+    commit = None
+    committed = False
+    failed_count = 0
+    for record in records:
+        if record["type"] == "commit":
+            commit = record
+        elif record["type"] == "committed":
+            committed = True
+        elif record["type"] == "staged":
+            failed_count = record["failed"]
+
+    if commit is None:
+        try:
+            manifest_entries = None if begin["archive"] else readManifest(backup_path)
+            if begin["archive"] or os.path.isdir(backup_path):
+                copied_count, failed_count, failed_files = stageBackup(
+                    backup_path, begin["archive"], manifest_entries, transaction, progress, begin["move"]
+                )
+            if not any(files for root, dirs, files in os.walk(transaction.staging_path)):
+                raise ValueError("No staged files")
+            if failed_count > 0:
+                transaction.copyBorrowedBack()
+                journal.record("staged", failed=failed_count)
+            commitRestore(transaction, begin["browserPath"], begin["browser"], progress, journal)
+        except Exception as e:
+            logging.error("Error resuming restore for {}: {}".format(begin["browser"], str(e)))
+            progress.metrics.addError(e)
+            if begin["move"]:
+                transaction.returnStaged(backup_path)
+            else:
+                transaction.discard()
+            return False, _("The interrupted restore for {browser} could not be finished. The previous data was kept.").format(
+                browser=begin["browser"]
+            )
+    elif not committed:
+        with progress.metrics.phase("commit"):
+            transaction.resumeCommit(commit["rollback"], commit["targets"])
+        journal.record("committed")
+        journal.sync()
+    else:
+        transaction.rollback_path = commit["rollback"]
+
+    finishRestore(transaction, backup_path, begin["archive"], keepBackup=failed_count > 0)
+    return True, _("Finished the interrupted restore for {browser}.").format(browser=begin["browser"])
+
+
+RESUMERS = {
+    "delete": resumeDelete,
+    "restore": resumeRestore,
+}
+
+
+def resumeInterruptedOperations():
+    messages = []
+    for path in findJournals(getJournalPath()):
+        records = readJournal(path)
+        if records and records[0]["type"] == "begin" and records[-1]["type"] != "end":
+            begin = records[0]
+            resume = RESUMERS.get(begin.get("operation"))
+        else:
+            resume = None
+        if resume is None:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            continue
+        if isBrowserRunning(begin["browser"]):
+            continue
+
+        journal = OperationJournal(path)
+        try:
+            success, message = runRecorded(
+                "resume",
+                begin["browser"],
+                lambda progress: resume(begin, records, journal, progress),
+                JobProgress()
+            )
+        except Exception as e:
+            logging.error("Error resuming {}: {}".format(path, str(e)))
+            journal.close()
+            continue
+        journal.complete()
+        messages.append(message)
+    return messages
+
+
+def quickRemoveBrowser(browser, progress=None):
+    if not isBrowserInstalled(browser):
+        return False, _("{browser} is not installed.").format(browser=browser)
+
+    if progress is None:
+        progress = JobProgress()
+    with progress.metrics.phase("processCheck"):
+        running_pids = getBrowserProcesses(browser)
+    if running_pids:
+        return False, _("{browser} is running with {count} processes. Please exit it before history deletion.").format(
+            browser=browser,
+            count=len(running_pids)
+        )
+
+    browser_path = getBrowserPath(browser)
+    if not browser_path or not os.path.exists(browser_path):
+        return False, _("Browser data path not found for {browser}.").format(browser=browser)
+
+    def quickClear(progress):
+        backup = config.conf["browserHistoryRemover"]["copyHistoryBeforeDeletion"]
+        plan = buildPlan(browser_path, browser, progress, sizeTargets=False, listBackup=backup)
+        if backup:
+            copy_success, copy_result = copyHistoryFiles(browser_path, browser, progress, plan)
+            if not copy_success:
+                return False, _("Failed to backup history for {browser}.").format(browser=browser)
+        delete_success, delete_result = clearHistory(browser_path, browser, progress, plan)
+        if not delete_success:
+            return False, _("Failed to delete history for {browser}.").format(browser=browser)
+        return True, _("History for {browser} has been deleted successfully.").format(browser=browser)
+
+    try:
+        return runRecorded("quickRemove", browser, quickClear, progress)
+    except Exception as e:
+        logging.error("Error deleting history for {}: {}".format(browser, str(e)))
+        return False, _("Failed to delete history for {browser}.").format(browser=browser)
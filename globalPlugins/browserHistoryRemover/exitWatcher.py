@@ -0,0 +1,86 @@
+import logging
+import threading
+import psutil
+from .browsers import BROWSER_PROCESSES
+from .processIndex import processIndex
+
+EXIT_DEBOUNCE = 3.0
+WAIT_SLICE = 5.0
+
+
+def openProcesses(pids):
+    procs = []
+    for pid in pids:
+        try:
+            procs.append(psutil.Process(pid))
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            continue
+    return procs
+
+
+def findRootProcesses(procs):
+    pids = set(proc.pid for proc in procs)
+    roots = []
+    for proc in procs:
+        try:
+            if proc.ppid() in pids:
+                continue
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            continue
+        roots.append(proc)
+    return roots or procs
+
+
+class ExitWatcher:
+    def __init__(self, onExit, debounce=EXIT_DEBOUNCE, waitSlice=WAIT_SLICE):
+        self.onExit = onExit
+        self.debounce = debounce
+        self.waitSlice = waitSlice
+        self.browser = None
+        self._stopped = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def isWatching(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def arm(self, browser):
+        with self._lock:
+            if self.isWatching() and self.browser == browser:
+                return
+            self.stop()
+            self.browser = browser
+            self._stopped = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(browser, self._stopped),
+                name="browserHistoryRemoverExitWatcher",
+                daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._thread = None
+
+    def findProcesses(self, browser):
+        processIndex.invalidate()
+        return findRootProcesses(openProcesses(processIndex.findPids(BROWSER_PROCESSES.get(browser, ()))))
+
+    def waitForExit(self, procs, stopped):
+        while procs and not stopped.is_set():
+            gone, procs = psutil.wait_procs(procs, timeout=self.waitSlice)
+
+    def _run(self, browser, stopped):
+        try:
+            procs = self.findProcesses(browser)
+            if not procs:
+                return
+            while procs:
+                self.waitForExit(procs, stopped)
+                if stopped.wait(self.debounce):
+                    return
+                procs = self.findProcesses(browser)
+            self.onExit(browser)
+        except Exception as e:
+            logging.error("Error watching {} for exit: {}".format(browser, str(e)))
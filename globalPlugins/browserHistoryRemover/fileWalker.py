@@ -0,0 +1,36 @@
+import os
+
+
+def scanTargets(rootPath, classifyFile, classifyDir=None):
+    pending = [rootPath]
+    while pending:
+        dirPath = pending.pop()
+        try:
+            scanner = os.scandir(dirPath)
+        except OSError:
+            continue
+        with scanner:
+            for entry in scanner:
+                try:
+                    isDir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if isDir:
+                    category = classifyDir(entry.name) if classifyDir else None
+                    if category:
+                        yield entry, category
+                    else:
+                        pending.append(entry.path)
+                else:
+                    category = classifyFile(entry.name)
+                    if category:
+                        yield entry, category
+
+
+def expandFiles(targets):
+    for entry, category in targets:
+        if entry.is_dir(follow_symlinks=False):
+            for child, matched in scanTargets(entry.path, bool):
+                yield child, category
+        else:
+            yield entry, category
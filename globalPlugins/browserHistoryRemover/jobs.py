@@ -0,0 +1,44 @@
+import logging
+import threading
+import wx
+from .progress import JobProgress
+
+
+def formatSize(size):
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            break
+        size /= 1024.0
+    if unit == "B":
+        return "{} {}".format(int(size), unit)
+    return "{:.1f} {}".format(size, unit)
+
+
+class Job:
+    def __init__(self, target, onProgress=None, onDone=None, metrics=None):
+        self.progress = JobProgress(onUpdate=self._postProgress if onProgress else None, metrics=metrics)
+        self._target = target
+        self._onProgress = onProgress
+        self._onDone = onDone
+        self._thread = threading.Thread(target=self._run, name="browserHistoryRemoverJob", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def cancel(self):
+        self.progress.cancel()
+
+    def isRunning(self):
+        return self._thread.is_alive()
+
+    def _postProgress(self, phase, files, bytes):
+        wx.CallAfter(self._onProgress, phase, files, bytes)
+
+    def _run(self):
+        try:
+            result = self._target(self.progress)
+        except Exception as e:
+            logging.error("Error in background job: {}".format(str(e)))
+            result = (False, str(e))
+        if self._onDone:
+            wx.CallAfter(self._onDone, result)
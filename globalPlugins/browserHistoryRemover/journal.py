@@ -0,0 +1,139 @@
+import json
+import logging
+import os
+import stat
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+JOURNAL_DIR = "journals"
+JOURNAL_EXTENSION = ".journal"
+FLUSH_RECORDS = 256
+FLUSH_INTERVAL = 1.0
+
+
+class PathEntry:
+    def __init__(self, path):
+        self.path = path
+        self.name = os.path.basename(path)
+
+    def is_dir(self, follow_symlinks=True):
+        try:
+            mode = os.stat(self.path).st_mode if follow_symlinks else os.lstat(self.path).st_mode
+        except OSError:
+            return False
+        return stat.S_ISDIR(mode)
+
+
+class OperationJournal:
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8")
+        self._pending = []
+        self._lastSync = time.monotonic()
+        self._lock = threading.Lock()
+
+    def record(self, kind, **fields):
+        fields["type"] = kind
+        line = json.dumps(fields, separators=(",", ":"))
+        with self._lock:
+            self._pending.append(line)
+            if len(self._pending) >= FLUSH_RECORDS or time.monotonic() - self._lastSync >= FLUSH_INTERVAL:
+                self._flush()
+
+    def sync(self):
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if self._file.closed:
+            return
+        if self._pending:
+            self._file.write("\n".join(self._pending) + "\n")
+            self._pending = []
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._lastSync = time.monotonic()
+
+    def close(self):
+        with self._lock:
+            self._flush()
+            self._file.close()
+
+    def complete(self):
+        self.record("end")
+        self.close()
+        try:
+            os.remove(self.path)
+        except OSError as e:
+            logging.error("Error removing journal {}: {}".format(self.path, str(e)))
+
+    def markDone(self, path):
+        self.record("done", path=path)
+
+
+class NullJournal:
+    def record(self, kind, **fields):
+        pass
+
+    def markDone(self, path):
+        pass
+
+    def sync(self):
+        pass
+
+    def close(self):
+        pass
+
+    def complete(self):
+        pass
+
+
+def startJournal(journal_dir, operation, **details):
+    try:
+        os.makedirs(journal_dir, exist_ok=True)
+        prefix = "{}-{}-".format(datetime.now().strftime("%Y-%m-%d_%H-%M-%S"), operation)
+        fd, path = tempfile.mkstemp(suffix=JOURNAL_EXTENSION, prefix=prefix, dir=journal_dir)
+        os.close(fd)
+        journal = OperationJournal(path)
+        journal.record("begin", operation=operation, **details)
+        journal.sync()
+        return journal
+    except OSError as e:
+        logging.error("Error creating journal for {}: {}".format(operation, str(e)))
+        return NullJournal()
+
+
+def readJournal(path):
+    records = []
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.endswith("\n"):
+                    break
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    break
+    except OSError:
+        pass
+    return records
+
+
+def findJournals(journal_dir):
+    try:
+        names = sorted(os.listdir(journal_dir))
+    except OSError:
+        return []
+    return [os.path.join(journal_dir, name) for name in names if name.endswith(JOURNAL_EXTENSION)]
+
+
+def findReferencedPaths(journal_dir):
+    referenced = set()
+    for path in findJournals(journal_dir):
+        for record in readJournal(path):
+            for key in ("staging", "rollback"):
+                if record.get(key):
+                    referenced.add(os.path.normcase(os.path.normpath(record[key])))
+    return referenced
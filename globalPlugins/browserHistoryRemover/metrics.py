@@ -0,0 +1,118 @@
+import cProfile
+import errno
+import json
+import logging
+import logging.handlers
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+METRICS_FILE = "metrics.jsonl"
+MAX_LOG_BYTES = 512 * 1024
+LOG_BACKUPS = 3
+PROFILES_DIR = "profiles"
+PROFILES_KEPT = 10
+
+
+def errorName(error):
+    code = getattr(error, "errno", None)
+    if code in errno.errorcode:
+        return errno.errorcode[code]
+    return type(error).__name__
+
+
+class OperationMetrics:
+    def __init__(self):
+        self.phases = {}
+        self.counters = {}
+        self.errors = {}
+        self._lock = threading.Lock()
+
+    def _add(self, table, key, amount):
+        with self._lock:
+            table[key] = table.get(key, 0) + amount
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._add(self.phases, name, time.perf_counter() - start)
+
+    def count(self, name, amount=1):
+        self._add(self.counters, name, amount)
+
+    def addError(self, error):
+        self._add(self.errors, errorName(error), 1)
+
+    def asRecord(self, operation, browser, result):
+        with self._lock:
+            return {
+                "time": datetime.now().isoformat(timespec="seconds"),
+                "operation": operation,
+                "browser": browser,
+                "success": bool(result[0]) if result else False,
+                "phases": dict((name, round(seconds, 4)) for name, seconds in self.phases.items()),
+                "counters": dict(self.counters),
+                "errors": dict(self.errors),
+            }
+
+
+class MetricsLog:
+    def __init__(self, log_dir):
+        self.log_dir = log_dir
+        self._logger = None
+        self._lock = threading.Lock()
+
+    def _getLogger(self):
+        with self._lock:
+            if self._logger is None:
+                os.makedirs(self.log_dir, exist_ok=True)
+                handler = logging.handlers.RotatingFileHandler(
+                    os.path.join(self.log_dir, METRICS_FILE),
+                    maxBytes=MAX_LOG_BYTES,
+                    backupCount=LOG_BACKUPS,
+                    encoding="utf-8",
+                    delay=True
+                )
+                handler.setFormatter(logging.Formatter("%(message)s"))
+                logger = logging.getLogger("browserHistoryRemover.metrics")
+                logger.setLevel(logging.INFO)
+                logger.propagate = False
+                logger.addHandler(handler)
+                self._logger = logger
+            return self._logger
+
+    def write(self, record):
+        try:
+            self._getLogger().info(json.dumps(record, sort_keys=True))
+        except Exception as e:
+            logging.error("Error writing metrics: {}".format(str(e)))
+
+    @contextmanager
+    def profile(self, operation, enabled):
+        if not enabled:
+            yield
+            return
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            self._saveProfile(profiler, operation)
+
+    def _saveProfile(self, profiler, operation):
+        profiles_dir = os.path.join(self.log_dir, PROFILES_DIR)
+        try:
+            os.makedirs(profiles_dir, exist_ok=True)
+            name = "{}-{}.prof".format(datetime.now().strftime("%Y-%m-%d_%H-%M-%S"), operation)
+            profiler.dump_stats(os.path.join(profiles_dir, name))
+            saved = sorted(name for name in os.listdir(profiles_dir) if name.endswith(".prof"))
+            for name in saved[:-PROFILES_KEPT]:
+                os.remove(os.path.join(profiles_dir, name))
+        except OSError as e:
+            logging.error("Error saving profile for {}: {}".format(operation, str(e)))
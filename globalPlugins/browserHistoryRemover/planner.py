@@ -0,0 +1,83 @@
+import logging
+from .fileWalker import expandFiles
+from .profileDiscovery import isInside, profileIndex
+from .targetRules import BACKUP_EXCLUDED_CATEGORIES, getTargetRules
+
+
+class HistoryPlan:
+    def __init__(self, browser, profile_path):
+        self.browser = browser
+        self.profile_path = profile_path
+        self.targets = []
+        self.backupFiles = []
+        self.categories = {}
+        self.backupBytes = 0
+        self.complete = False
+
+    def _count(self, category, size, files=1):
+        totals = self.categories.setdefault(category, [0, 0])
+        totals[0] += files
+        totals[1] += size
+
+    @property
+    def files(self):
+        return sum(totals[0] for totals in self.categories.values())
+
+    @property
+    def bytes(self):
+        return sum(totals[1] for totals in self.categories.values())
+
+    def select(self, categories, exclude=False):
+        plan = HistoryPlan(self.browser, self.profile_path)
+        plan.targets = [target for target in self.targets if (target[1] in categories) != exclude]
+        plan.backupFiles = [target for target in self.backupFiles if (target[1] in categories) != exclude]
+        plan.categories = dict(
+            (category, list(totals)) for category, totals in self.categories.items()
+            if (category in categories) != exclude
+        )
+        plan.backupBytes = sum(entry.stat(follow_symlinks=False).st_size for entry, category in plan.backupFiles)
+        plan.complete = self.complete
+        return plan
+
+
+def buildPlan(profile_path, browser, progress, scanIndex=None, sizeTargets=True, listBackup=True):
+    plan = HistoryPlan(browser, profile_path)
+    rules = getTargetRules(browser)
+    with progress.metrics.phase("discovery"):
+        data_paths = profileIndex.getDataPaths(profile_path, includeCache=True)
+    with progress.metrics.phase("scan"):
+        for data_path in data_paths:
+            backup = isInside(data_path, profile_path)
+            for target in rules.scan(data_path):
+                if progress.cancelled:
+                    return plan
+                plan.targets.append(target)
+                keep = listBackup and backup and target[1] not in BACKUP_EXCLUDED_CATEGORIES
+                if not sizeTargets and not keep:
+                    continue
+                if scanIndex and not keep and target[0].is_dir(follow_symlinks=False):
+                    files, size = scanIndex.summarize(profile_path, data_paths, target[0].path)
+                    plan._count(target[1], size, files)
+                    progress.advance(files=files, bytes=size)
+                    continue
+                for entry, category in expandFiles([target]):
+                    try:
+                        size = entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+                    plan._count(category, size)
+                    if keep:
+                        plan.backupFiles.append((entry, category))
+                        plan.backupBytes += size
+                    progress.advance(bytes=size)
+    plan.complete = True
+    progress.metrics.count("targetsMatched", len(plan.targets))
+    if sizeTargets:
+        progress.metrics.count("filesMatched", plan.files)
+        progress.metrics.count("bytesMatched", plan.bytes)
+    if scanIndex:
+        try:
+            scanIndex.save(profile_path)
+        except OSError as e:
+            logging.error("Error saving scan index: {}".format(str(e)))
+    return plan
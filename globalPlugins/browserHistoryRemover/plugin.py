@@ -0,0 +1,204 @@
+import addonHandler
+import globalPluginHandler
+import scriptHandler
+import ui
+import gui
+import wx
+import config
+import globalVars
+import os
+from .browsers import BROWSERS, BROWSER_PROCESSES, getBrowserPath
+from .journal import JOURNAL_DIR, findJournals
+from .trash import reaper
+
+addonHandler.initTranslation()
+
+ADDON_SUMMARY = "Browser History Remover"
+
+confspec = {
+    "copyHistoryBeforeDeletion": "boolean(default=False)",
+    "defaultBrowser": "string(default='Google Chrome')",
+    "deletionWorkers": "integer(default=4, min=1, max=32)",
+    "instantRemoval": "boolean(default=False)",
+    "backupFormat": 'option("folder", "deduplicated", "archive", default="deduplicated")',
+    "purgeRange": 'option("files", "all", "hour", "day", "week", default="files")',
+    "profileOperations": "boolean(default=False)",
+    "backupKeepCount": "integer(default=0, min=0, max=1000)",
+    "backupMaxAgeDays": "integer(default=0, min=0, max=3650)",
+    "backupQuotaMB": "integer(default=0, min=0, max=1048576)",
+    "secureOverwrite": "boolean(default=False)",
+    "autoClearOnExit": "boolean(default=False)",
+}
+
+config.conf.spec["browserHistoryRemover"] = confspec
+
+
+class GlobalPlugin(globalPluginHandler.GlobalPlugin):
+    def __init__(self):
+        super().__init__()
+        self.batchJob = None
+        self.quickJob = None
+        self.exitWatcher = None
+        self.createMenu()
+        journal_dir = os.path.join(globalVars.appArgs.configPath, "browserHistoryRemover", JOURNAL_DIR)
+        if findJournals(journal_dir):
+            reaper.run(self.resumeInterruptedOperations)
+        reaper.collectLeftovers([getBrowserPath(browser) for browser in BROWSERS], journal_dir)
+        if config.conf["browserHistoryRemover"]["autoClearOnExit"]:
+            self.armExitWatcher()
+
+    def resumeInterruptedOperations(self):
+        from .engine import resumeInterruptedOperations
+        for message in resumeInterruptedOperations():
+            wx.CallAfter(ui.message, message)
+
+    def createMenu(self):
+        self.toolsMenu = gui.mainFrame.sysTrayIcon.toolsMenu
+        self.menuItem = self.toolsMenu.Append(
+            wx.ID_ANY,
+            _("Browser History Remover"),
+            _("Remove browsing history for various browsers")
+        )
+        gui.mainFrame.sysTrayIcon.Bind(
+            wx.EVT_MENU,
+            self.onBrowserHistoryRemover,
+            self.menuItem
+        )
+
+    def terminate(self):
+        try:
+            self.toolsMenu.Remove(self.menuItem)
+        except Exception:
+            pass
+        if self.batchJob:
+            self.batchJob.cancel()
+        if self.quickJob:
+            self.quickJob.cancel()
+        if self.exitWatcher:
+            self.exitWatcher.stop()
+        reaper.stop()
+
+    def event_foreground(self, obj, nextHandler):
+        conf = config.conf["browserHistoryRemover"]
+        if conf["autoClearOnExit"]:
+            appName = getattr(getattr(obj, "appModule", None), "appName", None)
+            if appName and appName + ".exe" in BROWSER_PROCESSES.get(conf["defaultBrowser"], ()):
+                self.armExitWatcher()
+        nextHandler()
+
+    def armExitWatcher(self):
+        if self.exitWatcher is None:
+            from .exitWatcher import ExitWatcher
+            self.exitWatcher = ExitWatcher(self.onBrowserExit)
+        self.exitWatcher.arm(config.conf["browserHistoryRemover"]["defaultBrowser"])
+
+    def onBrowserExit(self, browser):
+        wx.CallAfter(self.autoClearHistory, browser)
+
+    def autoClearHistory(self, browser):
+        conf = config.conf["browserHistoryRemover"]
+        if not conf["autoClearOnExit"] or conf["defaultBrowser"] != browser:
+            return
+        if self.quickJob or self.batchJob:
+            return
+        self.startQuickRemove(browser)
+
+    def startQuickRemove(self, browser):
+        from .engine import quickRemoveBrowser
+        from .jobs import Job
+
+        self.quickJob = Job(lambda progress: quickRemoveBrowser(browser, progress), onDone=self.onQuickRemoveDone)
+        self.quickJob.start()
+
+    def onQuickRemoveDone(self, result):
+        self.quickJob = None
+        success, message = result
+        ui.message(message)
+
+    def onBrowserHistoryRemover(self, evt):
+        wx.CallAfter(self.showDialog)
+
+    def showDialog(self):
+        from .dialogs import BrowserHistoryRemoverDialog
+        gui.mainFrame.prePopup()
+        dialog = None
+        try:
+            dialog = BrowserHistoryRemoverDialog(gui.mainFrame)
+            dialog.ShowModal()
+        finally:
+            if dialog:
+                try:
+                    dialog.Destroy()
+                except RuntimeError:
+                    pass
+            gui.mainFrame.postPopup()
+
+    @scriptHandler.script(
+        description=_("Open Browser History Remover"),
+        category=_("Browser History Remover"),
+        gesture="kb:NVDA+alt+b"
+    )
+    def script_openBrowserHistoryRemover(self, gesture):
+        wx.CallAfter(self.showDialog)
+
+    @scriptHandler.script(
+        description=_("Quick remove history for default browser"),
+        category=_("Browser History Remover"),
+        gesture="kb:NVDA+alt+d"
+    )
+    def script_quickRemoveHistory(self, gesture):
+        wx.CallAfter(self.quickRemoveHistory)
+
+    def quickRemoveHistory(self):
+        if self.quickJob or self.batchJob:
+            ui.message(_("History removal is already in progress."))
+            return
+        self.startQuickRemove(config.conf["browserHistoryRemover"]["defaultBrowser"])
+
+    @scriptHandler.script(
+        description=_("Quick remove history for all installed browsers"),
+        category=_("Browser History Remover"),
+        gesture="kb:NVDA+alt+shift+d"
+    )
+    def script_quickRemoveAllHistory(self, gesture):
+        wx.CallAfter(self.quickRemoveAllHistory)
+
+    def quickRemoveAllHistory(self):
+        from .engine import clearAllBrowsers, getBatchBrowsers, runRecorded
+        from .jobs import Job
+        from .metrics import OperationMetrics
+
+        if self.batchJob:
+            ui.message(_("History removal for all browsers is already in progress."))
+            return
+        if self.quickJob:
+            ui.message(_("History removal is already in progress."))
+            return
+
+        metrics = OperationMetrics()
+        with metrics.phase("processCheck"):
+            browsers, running = getBatchBrowsers()
+        if not browsers:
+            if running:
+                ui.message(_("All installed browsers are running. Please exit them before history deletion."))
+            else:
+                ui.message(_("No supported browsers are installed."))
+            return
+
+        ui.message(_("Removing history for {count} browsers.").format(count=len(browsers)))
+        self.batchJob = Job(
+            lambda progress: runRecorded(
+                "clearAll",
+                None,
+                lambda progress: clearAllBrowsers(browsers, running, progress),
+                progress
+            ),
+            onDone=self.onQuickRemoveAllDone,
+            metrics=metrics
+        )
+        self.batchJob.start()
+
+    def onQuickRemoveAllDone(self, result):
+        self.batchJob = None
+        success, summary = result
+        ui.message(summary)
@@ -0,0 +1,50 @@
+import time
+import threading
+import psutil
+
+DEFAULT_TTL = 2.0
+
+
+class ProcessSnapshot:
+    def __init__(self):
+        self.pidsByName = {}
+        try:
+            for proc in psutil.process_iter(['name']):
+                try:
+                    proc_name = proc.info.get('name')
+                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                    continue
+                if proc_name:
+                    self.pidsByName.setdefault(proc_name.lower(), []).append(proc.pid)
+        except Exception:
+            pass
+        self.takenAt = time.monotonic()
+
+    def findPids(self, names):
+        pids = []
+        for name in names:
+            pids.extend(self.pidsByName.get(name, ()))
+        return pids
+
+
+class ProcessIndex:
+    def __init__(self, ttl=DEFAULT_TTL):
+        self.ttl = ttl
+        self._snapshot = None
+        self._lock = threading.Lock()
+
+    def snapshot(self):
+        with self._lock:
+            if self._snapshot is None or time.monotonic() - self._snapshot.takenAt > self.ttl:
+                self._snapshot = ProcessSnapshot()
+            return self._snapshot
+
+    def invalidate(self):
+        with self._lock:
+            self._snapshot = None
+
+    def findPids(self, names):
+        return self.snapshot().findPids(names)
+
+
+processIndex = ProcessIndex()
@@ -0,0 +1,160 @@
+import collections
+import configparser
+import json
+import logging
+import os
+import threading
+
+LOCAL_STATE_FILE = "Local State"
+PROFILES_INI = "profiles.ini"
+INSTALLS_INI = "installs.ini"
+CHROMIUM_DEFAULT_PROFILE = "Default"
+CHROMIUM_EXTRA_PROFILES = ("Guest Profile",)
+GECKO_PROFILES_DIR = "Profiles"
+
+Profile = collections.namedtuple("Profile", ("name", "path", "cachePath"))
+
+
+def getLocalCachePath(path):
+    parts = os.path.normpath(path).split(os.sep)
+    for index in range(len(parts) - 1):
+        if parts[index].lower() == "appdata" and parts[index + 1].lower() == "roaming":
+            return os.sep.join(parts[:index + 1] + ["Local"] + parts[index + 2:])
+    return None
+
+
+def isInside(path, root_path):
+    path = os.path.normcase(os.path.normpath(path))
+    root_path = os.path.normcase(os.path.normpath(root_path))
+    try:
+        return os.path.commonpath([path, root_path]) == root_path
+    except ValueError:
+        return False
+
+
+def readChromiumProfiles(root_path):
+    with open(os.path.join(root_path, LOCAL_STATE_FILE), "r", encoding="utf-8") as f:
+        local_state = json.load(f)
+    names = list(local_state.get("profile", {}).get("info_cache", {}))
+    names.extend(CHROMIUM_EXTRA_PROFILES)
+    profiles = []
+    for name in names:
+        path = os.path.join(root_path, name)
+        if os.path.isdir(path):
+            profiles.append(Profile(name, path, getLocalCachePath(path)))
+    return profiles
+
+
+def readIni(ini_path):
+    parser = configparser.RawConfigParser(strict=False)
+    parser.optionxform = str
+    parser.read(ini_path, encoding="utf-8")
+    return parser
+
+
+def readGeckoProfiles(ini_dir):
+    entries = []
+    parser = readIni(os.path.join(ini_dir, PROFILES_INI))
+    for section in parser.sections():
+        if not parser.has_option(section, "Path"):
+            continue
+        is_relative = parser.get(section, "IsRelative", fallback="1") != "0"
+        entries.append((parser.get(section, "Name", fallback=section), parser.get(section, "Path"), is_relative))
+    installs_path = os.path.join(ini_dir, INSTALLS_INI)
+    if os.path.exists(installs_path):
+        parser = readIni(installs_path)
+        for section in parser.sections():
+            if parser.has_option(section, "Default"):
+                entries.append((section, parser.get(section, "Default"), True))
+
+    profiles = []
+    seen = set()
+    for name, path, is_relative in entries:
+        if is_relative:
+            path = os.path.join(ini_dir, *path.replace("\\", "/").split("/"))
+        path = os.path.normpath(path)
+        key = os.path.normcase(path)
+        if key in seen or not os.path.isdir(path):
+            continue
+        seen.add(key)
+        profiles.append(Profile(name, path, getLocalCachePath(path)))
+    return profiles
+
+
+def discoverProfiles(root_path):
+    try:
+        if os.path.exists(os.path.join(root_path, LOCAL_STATE_FILE)):
+            profiles = readChromiumProfiles(root_path)
+        elif os.path.exists(os.path.join(os.path.dirname(root_path), PROFILES_INI)):
+            profiles = readGeckoProfiles(os.path.dirname(root_path))
+        else:
+            profiles = []
+    except (OSError, ValueError, configparser.Error) as e:
+        logging.error("Error reading profiles in {}: {}".format(root_path, str(e)))
+        profiles = []
+    return profiles or guessProfiles(root_path)
+
+
+def guessProfiles(root_path):
+    if os.path.basename(os.path.normpath(root_path)) == GECKO_PROFILES_DIR:
+        try:
+            with os.scandir(root_path) as scanner:
+                paths = [entry.path for entry in scanner if entry.is_dir(follow_symlinks=False)]
+        except OSError:
+            paths = []
+    elif os.path.isdir(os.path.join(root_path, CHROMIUM_DEFAULT_PROFILE)):
+        paths = [os.path.join(root_path, CHROMIUM_DEFAULT_PROFILE)]
+    else:
+        paths = [root_path]
+    return [Profile(os.path.basename(path), path, getLocalCachePath(path)) for path in paths]
+
+
+def _sourceSignature(root_path):
+    signature = []
+    for path in (
+        os.path.join(root_path, LOCAL_STATE_FILE),
+        os.path.join(os.path.dirname(root_path), PROFILES_INI),
+        os.path.join(os.path.dirname(root_path), INSTALLS_INI),
+        root_path,
+    ):
+        try:
+            signature.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+class ProfileIndex:
+    def __init__(self):
+        self._profiles = {}
+        self._lock = threading.Lock()
+
+    def getProfiles(self, root_path):
+        signature = _sourceSignature(root_path)
+        with self._lock:
+            cached = self._profiles.get(root_path)
+            if cached and cached[0] == signature:
+                return cached[1]
+        profiles = discoverProfiles(root_path)
+        with self._lock:
+            self._profiles[root_path] = (signature, profiles)
+        return profiles
+
+    def invalidate(self, root_path=None):
+        with self._lock:
+            if root_path is None:
+                self._profiles.clear()
+            else:
+                self._profiles.pop(root_path, None)
+
+    def getDataPaths(self, root_path, includeCache=False, includeExternal=True):
+        paths = []
+        for profile in self.getProfiles(root_path):
+            if includeExternal or isInside(profile.path, root_path):
+                paths.append(profile.path)
+            if includeCache and profile.cachePath and os.path.isdir(profile.cachePath):
+                paths.append(profile.cachePath)
+        return paths
+
+
+profileIndex = ProfileIndex()
@@ -0,0 +1,53 @@
+import time
+from .metrics import OperationMetrics
+
+DEFAULT_INTERVAL = 0.5
+CHECK_EVERY = 16
+
+
+class JobProgress:
+    def __init__(self, onUpdate=None, interval=DEFAULT_INTERVAL, metrics=None):
+        self.phase = ""
+        self.metrics = metrics or OperationMetrics()
+        self.files = 0
+        self.bytes = 0
+        self.cancelled = False
+        self._onUpdate = onUpdate
+        self._interval = interval
+        self._ticks = 0
+        self._lastUpdate = time.monotonic()
+
+    def setPhase(self, phase):
+        self.phase = phase
+        self.files = 0
+        self.bytes = 0
+        self._update(time.monotonic())
+
+    def advance(self, files=1, bytes=0):
+        self.files += files
+        self.bytes += bytes
+        if self._onUpdate is None:
+            return
+        self._ticks += 1
+        if self._ticks < CHECK_EVERY:
+            return
+        self._ticks = 0
+        now = time.monotonic()
+        if now - self._lastUpdate >= self._interval:
+            self._update(now)
+
+    def cancel(self):
+        self.cancelled = True
+
+    def _update(self, now):
+        self._lastUpdate = now
+        if self._onUpdate is not None:
+            self._onUpdate(self.phase, self.files, self.bytes)
+
+
+def trackTargets(targets, progress):
+    for entry, category in targets:
+        if progress.cancelled:
+            return
+        yield entry, category
+        progress.advance()
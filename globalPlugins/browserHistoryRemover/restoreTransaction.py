@@ -0,0 +1,153 @@
+import os
+import shutil
+import tempfile
+from .backupStore import copyWithDigest
+from .backupArchive import resolveMemberPath
+from .journal import NullJournal
+from .trash import TRASH_PREFIX, ROLLBACK_PREFIX, getTrashParent, reaper
+
+STAGING_PREFIX = TRASH_PREFIX + "staging-"
+
+
+def isSameVolume(first_path, second_path):
+    try:
+        return os.stat(first_path).st_dev == os.stat(second_path).st_dev
+    except OSError:
+        return False
+
+
+class RestoreTransaction:
+    def __init__(self, browser_path, staging_path=None):
+        self.browser_path = browser_path
+        self.parent_path = getTrashParent(browser_path)
+        if staging_path:
+            os.makedirs(staging_path, exist_ok=True)
+            self.staging_path = staging_path
+        else:
+            self.staging_path = tempfile.mkdtemp(prefix=STAGING_PREFIX, dir=self.parent_path)
+        self.rollback_path = None
+        self._createdDirs = set()
+        self._borrowed = []
+        self._movedAside = []
+        self._placed = []
+
+    def _ensureDir(self, dir_path):
+        if dir_path not in self._createdDirs:
+            os.makedirs(dir_path, exist_ok=True)
+            self._createdDirs.add(dir_path)
+
+    def stageFile(self, src_path, relative_path, move=False, mtime_ns=None):
+        staged_path = resolveMemberPath(self.staging_path, relative_path)
+        self._ensureDir(os.path.dirname(staged_path))
+        if move and not os.path.lexists(src_path) and os.path.isfile(staged_path):
+            return None, os.path.getsize(staged_path)
+        if move and os.stat(src_path).st_nlink == 1:
+            os.rename(src_path, staged_path)
+            self._borrowed.append((src_path, staged_path))
+            return None, os.path.getsize(staged_path)
+        digest, size = copyWithDigest(src_path, staged_path)
+        if mtime_ns is None:
+            src_stat = os.stat(src_path)
+            os.utime(staged_path, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+        else:
+            os.utime(staged_path, ns=(mtime_ns, mtime_ns))
+        return digest, size
+
+    def unstageFile(self, src_path, relative_path):
+        staged_path = resolveMemberPath(self.staging_path, relative_path)
+        if os.path.lexists(src_path):
+            os.remove(staged_path)
+            return
+        os.rename(staged_path, src_path)
+        self._borrowed = [pair for pair in self._borrowed if pair[1] != staged_path]
+
+    def copyBorrowedBack(self):
+        for src_path, staged_path in self._borrowed:
+            shutil.copy2(staged_path, src_path)
+        self._borrowed = []
+
+    def commit(self, live_targets, journal=None):
+        live_paths = [entry.path for entry, category in live_targets]
+        self.rollback_path = tempfile.mkdtemp(prefix=ROLLBACK_PREFIX, dir=self.parent_path)
+        journal = journal or NullJournal()
+        journal.record("commit", rollback=self.rollback_path, targets=live_paths)
+        journal.sync()
+        try:
+            for index, live_path in enumerate(live_paths):
+                aside_path = os.path.join(self.rollback_path, str(index))
+                os.rename(live_path, aside_path)
+                self._movedAside.append((live_path, aside_path))
+            self._swapIn(self.staging_path, self.browser_path)
+        except Exception:
+            self.rollback()
+            raise
+
+    def resumeCommit(self, rollback_path, live_paths):
+        self.rollback_path = rollback_path
+        os.makedirs(rollback_path, exist_ok=True)
+        for index, live_path in enumerate(live_paths):
+            aside_path = os.path.join(rollback_path, str(index))
+            if os.path.lexists(live_path) and not os.path.lexists(aside_path):
+                os.rename(live_path, aside_path)
+        self._swapIn(self.staging_path, self.browser_path)
+
+    def _swapIn(self, staged_dir, live_dir):
+        with os.scandir(staged_dir) as scanner:
+            entries = list(scanner)
+        for entry in entries:
+            live_path = os.path.join(live_dir, entry.name)
+            if entry.is_dir(follow_symlinks=False) and os.path.isdir(live_path):
+                self._swapIn(entry.path, live_path)
+                continue
+            os.replace(entry.path, live_path)
+            self._placed.append((entry.path, live_path))
+
+    def rollback(self):
+        for staged_path, live_path in reversed(self._placed):
+            try:
+                os.replace(live_path, staged_path)
+            except OSError:
+                pass
+        self._placed = []
+        for live_path, aside_path in reversed(self._movedAside):
+            try:
+                os.rename(aside_path, live_path)
+            except OSError:
+                pass
+        self._movedAside = []
+        if self.rollback_path:
+            try:
+                os.rmdir(self.rollback_path)
+            except OSError:
+                pass
+            self.rollback_path = None
+
+    def discard(self):
+        for src_path, staged_path in reversed(self._borrowed):
+            try:
+                os.makedirs(os.path.dirname(src_path), exist_ok=True)
+                os.rename(staged_path, src_path)
+            except OSError:
+                pass
+        self._borrowed = []
+        shutil.rmtree(self.staging_path, ignore_errors=True)
+
+    def returnStaged(self, backup_path):
+        for root, dirs, files in os.walk(self.staging_path):
+            for name in files:
+                staged_path = os.path.join(root, name)
+                src_path = os.path.join(backup_path, os.path.relpath(staged_path, self.staging_path))
+                if os.path.lexists(src_path):
+                    continue
+                try:
+                    os.makedirs(os.path.dirname(src_path), exist_ok=True)
+                    os.rename(staged_path, src_path)
+                except OSError:
+                    pass
+        shutil.rmtree(self.staging_path, ignore_errors=True)
+
+    def finish(self):
+        shutil.rmtree(self.staging_path, ignore_errors=True)
+        if self.rollback_path:
+            reaper.reap(self.rollback_path)
+            self.rollback_path = None
@@ -0,0 +1,216 @@
+import collections
+import json
+import logging
+import os
+import re
+import shutil
+from datetime import datetime, timedelta
+from .backupStore import OBJECTS_DIR
+from .snapshotManifest import MANIFEST_FILE, readManifest
+
+RETENTION_INDEX_FILE = "retention.json"
+INDEX_VERSION = 1
+TIMESTAMP_FORMAT = "%Y-%m-%d_%H-%M-%S"
+SNAPSHOT_PATTERN = re.compile(r"^(\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})(\.zip)?$")
+DIGEST_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+
+class RetentionPolicy:
+    def __init__(self, keepCount=0, maxAgeDays=0, quotaBytes=0):
+        self.keepCount = keepCount
+        self.maxAgeDays = maxAgeDays
+        self.quotaBytes = quotaBytes
+
+    @property
+    def enabled(self):
+        return bool(self.keepCount or self.maxAgeDays or self.quotaBytes)
+
+
+def measureSnapshot(path, isArchive):
+    if isArchive:
+        return {"bytes": os.stat(path).st_size, "objects": {}}
+
+    owned = 0
+    objects = {}
+    manifest_entries = readManifest(path)
+    if manifest_entries is None:
+        for root, dirs, files in os.walk(path):
+            for name in files:
+                try:
+                    owned += os.stat(os.path.join(root, name)).st_size
+                except OSError:
+                    continue
+        return {"bytes": owned, "objects": objects}
+
+    for item in manifest_entries:
+        try:
+            stat = os.stat(os.path.join(path, *item["path"].split("/")))
+        except (OSError, KeyError):
+            continue
+        if stat.st_nlink > 1 and item.get("sha256"):
+            objects[item["sha256"]] = stat.st_size
+        else:
+            owned += stat.st_size
+    try:
+        owned += os.stat(os.path.join(path, MANIFEST_FILE)).st_size
+    except OSError:
+        pass
+    return {"bytes": owned, "objects": objects}
+
+
+class StorageUsage:
+    def __init__(self, records):
+        self.owned = 0
+        self.shared = 0
+        self._refs = collections.Counter()
+        self._sizes = {}
+        for record in records:
+            self.add(record)
+
+    @property
+    def total(self):
+        return self.owned + self.shared
+
+    def add(self, record):
+        self.owned += record["bytes"]
+        for digest, size in record["objects"].items():
+            if self._refs[digest] == 0:
+                self.shared += size
+                self._sizes[digest] = size
+            self._refs[digest] += 1
+
+    def remove(self, record):
+        self.owned -= record["bytes"]
+        for digest in record["objects"]:
+            self._refs[digest] -= 1
+            if self._refs[digest] == 0:
+                self.shared -= self._sizes.pop(digest)
+                del self._refs[digest]
+
+
+class BackupRetention:
+    def __init__(self, base_path):
+        self.base_path = base_path
+        self.index_path = os.path.join(base_path, RETENTION_INDEX_FILE)
+        self.objects_path = os.path.join(base_path, OBJECTS_DIR)
+
+    def _loadIndex(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == INDEX_VERSION:
+                return data.get("snapshots", {})
+        except (OSError, ValueError, AttributeError):
+            pass
+        return {}
+
+    def _saveIndex(self, snapshots):
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": INDEX_VERSION, "snapshots": snapshots}, f)
+        os.replace(tmp_path, self.index_path)
+
+    def scan(self):
+        index = self._loadIndex()
+        snapshots = []
+        changed = False
+        with os.scandir(self.base_path) as scanner:
+            for entry in scanner:
+                match = SNAPSHOT_PATTERN.match(entry.name)
+                if not match:
+                    continue
+                isArchive = bool(match.group(2))
+                try:
+                    if entry.is_dir(follow_symlinks=False) == isArchive:
+                        continue
+                    mtime = entry.stat(follow_symlinks=False).st_mtime_ns
+                    record = index.get(entry.name)
+                    if not record or record.get("mtime") != mtime:
+                        record = measureSnapshot(entry.path, isArchive)
+                        record["mtime"] = mtime
+                        changed = True
+                except OSError:
+                    continue
+                snapshots.append((match.group(1), entry.name, entry.path, record))
+        snapshots.sort()
+        if len(snapshots) != len(index):
+            changed = True
+        return snapshots, changed
+
+    def selectExpired(self, snapshots, policy, now=None):
+        if len(snapshots) < 2:
+            return []
+        candidates = snapshots[:-1]
+        expired = set()
+
+        if policy.keepCount:
+            expired.update(snapshot[1] for snapshot in snapshots[:-policy.keepCount])
+
+        if policy.maxAgeDays:
+            cutoff = (now or datetime.now()) - timedelta(days=policy.maxAgeDays)
+            for snapshot in candidates:
+                if datetime.strptime(snapshot[0], TIMESTAMP_FORMAT) < cutoff:
+                    expired.add(snapshot[1])
+
+        if policy.quotaBytes:
+            usage = StorageUsage(snapshot[3] for snapshot in snapshots if snapshot[1] not in expired)
+            for snapshot in candidates:
+                if usage.total <= policy.quotaBytes:
+                    break
+                if snapshot[1] not in expired:
+                    usage.remove(snapshot[3])
+                    expired.add(snapshot[1])
+
+        return [snapshot for snapshot in candidates if snapshot[1] in expired]
+
+    def prune(self, policy, now=None):
+        if not os.path.isdir(self.base_path):
+            return 0, 0
+        snapshots, changed = self.scan()
+        expired = self.selectExpired(snapshots, policy, now)
+        before = StorageUsage(snapshot[3] for snapshot in snapshots).total
+
+        removed = []
+        for snapshot in expired:
+            try:
+                if snapshot[1].endswith(".zip"):
+                    os.remove(snapshot[2])
+                else:
+                    shutil.rmtree(snapshot[2])
+            except OSError as e:
+                logging.error("Error removing old backup {}: {}".format(snapshot[2], str(e)))
+                continue
+            removed.append(snapshot)
+
+        kept = [snapshot for snapshot in snapshots if snapshot not in removed]
+        if any(snapshot[3]["objects"] for snapshot in removed):
+            self.collectObjects(kept)
+        if removed or changed:
+            self._saveIndex(dict((snapshot[1], snapshot[3]) for snapshot in kept))
+        return len(removed), before - StorageUsage(snapshot[3] for snapshot in kept).total
+
+    def collectObjects(self, kept):
+        referenced = set()
+        for snapshot in kept:
+            referenced.update(snapshot[3]["objects"])
+        try:
+            with os.scandir(self.objects_path) as scanner:
+                buckets = [entry.path for entry in scanner if entry.is_dir(follow_symlinks=False)]
+        except OSError:
+            return
+        for bucket in buckets:
+            try:
+                with os.scandir(bucket) as scanner:
+                    entries = [entry for entry in scanner if DIGEST_PATTERN.match(entry.name) and entry.name not in referenced]
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    if entry.stat(follow_symlinks=False).st_nlink == 1:
+                        os.remove(entry.path)
+                except OSError:
+                    continue
+            try:
+                os.rmdir(bucket)
+            except OSError:
+                pass
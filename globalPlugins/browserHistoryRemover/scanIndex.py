@@ -0,0 +1,96 @@
+import json
+import os
+import threading
+
+INDEX_VERSION = 1
+
+
+class ScanIndex:
+    def __init__(self, index_path):
+        self.index_path = index_path
+        self._roots = None
+        self._seen = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._roots is None:
+            try:
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == INDEX_VERSION:
+                    self._roots = data.get("roots", {})
+            except (OSError, ValueError, AttributeError):
+                pass
+            if self._roots is None:
+                self._roots = {}
+        return self._roots
+
+    def _dirs(self, root_path, profile_paths):
+        profiles = sorted(profile_paths)
+        with self._lock:
+            roots = self._load()
+            entry = roots.get(root_path)
+            if not entry or entry.get("profiles") != profiles:
+                entry = roots[root_path] = {"profiles": profiles, "dirs": {}}
+                self._dirty = True
+            self._seen.setdefault(root_path, set())
+            return entry["dirs"], self._seen[root_path]
+
+    def summarize(self, root_path, profile_paths, dir_path):
+        dirs, seen = self._dirs(root_path, profile_paths)
+        files = 0
+        total = 0
+        pending = [dir_path]
+        while pending:
+            path = pending.pop()
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+            cached = dirs.get(path)
+            if cached and cached[0] == mtime:
+                count, size, subdirs = cached[1], cached[2], cached[3]
+            else:
+                count = 0
+                size = 0
+                subdirs = []
+                try:
+                    with os.scandir(path) as scanner:
+                        for entry in scanner:
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    subdirs.append(entry.name)
+                                else:
+                                    count += 1
+                                    size += entry.stat(follow_symlinks=False).st_size
+                            except OSError:
+                                continue
+                except OSError:
+                    continue
+                with self._lock:
+                    dirs[path] = [mtime, count, size, subdirs]
+                    self._dirty = True
+            with self._lock:
+                seen.add(path)
+            files += count
+            total += size
+            pending.extend(os.path.join(path, name) for name in subdirs)
+        return files, total
+
+    def save(self, root_path):
+        with self._lock:
+            seen = self._seen.pop(root_path, None)
+            if seen is not None:
+                dirs = self._roots[root_path]["dirs"]
+                for path in [path for path in dirs if path not in seen]:
+                    del dirs[path]
+                    self._dirty = True
+            if not self._dirty:
+                return
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            tmp_path = self.index_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": INDEX_VERSION, "roots": self._roots}, f)
+            os.replace(tmp_path, self.index_path)
+            self._dirty = False
@@ -0,0 +1,99 @@
+import os
+import shutil
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_WORKERS = 4
+CHUNK_SIZE = 1024 * 1024
+OPEN_FLAGS = os.O_WRONLY | getattr(os, "O_BINARY", 0)
+
+
+def _ignoreError(error):
+    pass
+
+
+def overwriteFile(path, view):
+    fd = os.open(path, OPEN_FLAGS)
+    try:
+        remaining = os.fstat(fd).st_size
+        written = remaining
+        chunk = len(view)
+        while remaining > 0:
+            remaining -= os.write(fd, view[:remaining] if remaining < chunk else view)
+        os.fsync(fd)
+        os.ftruncate(fd, 0)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    return written
+
+
+def shredFile(path, view):
+    size = overwriteFile(path, view)
+    hidden_path = os.path.join(os.path.dirname(path), uuid.uuid4().hex)
+    try:
+        os.rename(path, hidden_path)
+    except OSError:
+        hidden_path = path
+    os.remove(hidden_path)
+    return size
+
+
+class Shredder:
+    def __init__(self, workers=DEFAULT_WORKERS, chunkSize=CHUNK_SIZE, onError=None):
+        self.workers = max(1, workers)
+        self.chunkSize = max(4096, chunkSize)
+        self.onError = onError or _ignoreError
+        self._local = threading.local()
+
+    def _getView(self):
+        view = getattr(self._local, "view", None)
+        if view is None:
+            view = memoryview(bytearray(self.chunkSize))
+            self._local.view = view
+        return view
+
+    def _shred(self, path):
+        try:
+            return 1, 0, shredFile(path, self._getView())
+        except OSError as e:
+            self.onError(e)
+        try:
+            os.remove(path)
+            return 0, 1, 0
+        except OSError:
+            return 0, 0, 0
+
+    def _expand(self, targets, pendingDirs):
+        for entry, category in targets:
+            try:
+                isDir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if not isDir:
+                yield entry.path
+                continue
+            pendingDirs.append(entry.path)
+            for root, dirs, files in os.walk(entry.path):
+                for name in files:
+                    yield os.path.join(root, name)
+
+    def shredTargets(self, targets):
+        pendingDirs = []
+        shredded_files = 0
+        removed_files = 0
+        shredded_bytes = 0
+        paths = self._expand(targets, pendingDirs)
+        if self.workers == 1:
+            results = map(self._shred, paths)
+        else:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                results = list(executor.map(self._shred, list(paths)))
+        for shredded, removed, size in results:
+            shredded_files += shredded
+            removed_files += removed
+            shredded_bytes += size
+        for dir_path in pendingDirs:
+            shutil.rmtree(dir_path, onerror=lambda function, failed_path, excInfo: self.onError(excInfo[1]))
+        return shredded_files, removed_files, len(pendingDirs), shredded_bytes
@@ -0,0 +1,33 @@
+import json
+import os
+
+MANIFEST_FILE = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+def manifestEntry(relative_path, size, mtime_ns, digest):
+    return {
+        "path": relative_path.replace(os.sep, "/"),
+        "size": size,
+        "mtime": mtime_ns,
+        "sha256": digest,
+    }
+
+
+def writeManifest(snapshot_path, entries):
+    manifest_path = os.path.join(snapshot_path, MANIFEST_FILE)
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": MANIFEST_VERSION, "files": entries}, f)
+    os.replace(tmp_path, manifest_path)
+
+
+def readManifest(snapshot_path):
+    try:
+        with open(os.path.join(snapshot_path, MANIFEST_FILE), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return None
+    return manifest.get("files") or []
@@ -0,0 +1,137 @@
+import logging
+import sqlite3
+import time
+
+PURGE_RANGES = {
+    "hour": 60 * 60,
+    "day": 24 * 60 * 60,
+    "week": 7 * 24 * 60 * 60,
+    "all": None,
+}
+
+BATCH_SIZE = 2000
+VACUUM_FREE_RATIO = 0.25
+INCREMENTAL_VACUUM = 2
+WEBKIT_EPOCH_OFFSET = 11644473600
+
+
+def webkitTime(unix_seconds):
+    return int((unix_seconds + WEBKIT_EPOCH_OFFSET) * 1000000)
+
+
+def prTime(unix_seconds):
+    return int(unix_seconds * 1000000)
+
+
+CHROMIUM_HISTORY = (
+    ("visits", "DELETE FROM visits WHERE id IN (SELECT id FROM visits WHERE visit_time >= :cutoff LIMIT :limit)"),
+    ("visit_source", "DELETE FROM visit_source WHERE id IN (SELECT id FROM visit_source WHERE id NOT IN (SELECT id FROM visits) LIMIT :limit)"),
+    ("urls", "DELETE FROM urls WHERE id IN (SELECT id FROM urls WHERE last_visit_time >= :cutoff AND id NOT IN (SELECT url FROM visits) LIMIT :limit)"),
+    ("keyword_search_terms", "DELETE FROM keyword_search_terms WHERE rowid IN (SELECT rowid FROM keyword_search_terms WHERE url_id NOT IN (SELECT id FROM urls) LIMIT :limit)"),
+    ("segment_usage", "DELETE FROM segment_usage WHERE id IN (SELECT id FROM segment_usage WHERE time_slot >= :cutoff LIMIT :limit)"),
+    ("downloads", "DELETE FROM downloads WHERE id IN (SELECT id FROM downloads WHERE start_time >= :cutoff LIMIT :limit)"),
+    ("downloads_url_chains", "DELETE FROM downloads_url_chains WHERE rowid IN (SELECT rowid FROM downloads_url_chains WHERE id NOT IN (SELECT id FROM downloads) LIMIT :limit)"),
+)
+
+CHROMIUM_HISTORY_FIXUPS = (
+    ("urls", "UPDATE urls SET visit_count = (SELECT COUNT(*) FROM visits WHERE visits.url = urls.id), last_visit_time = (SELECT IFNULL(MAX(visit_time), 0) FROM visits WHERE visits.url = urls.id) WHERE last_visit_time >= :cutoff"),
+)
+
+CHROMIUM_COOKIES = (
+    ("cookies", "DELETE FROM cookies WHERE rowid IN (SELECT rowid FROM cookies WHERE creation_utc >= :cutoff LIMIT :limit)"),
+)
+
+FIREFOX_PLACES = (
+    ("moz_historyvisits", "DELETE FROM moz_historyvisits WHERE id IN (SELECT id FROM moz_historyvisits WHERE visit_date >= :cutoff LIMIT :limit)"),
+    ("moz_places", "DELETE FROM moz_places WHERE id IN (SELECT id FROM moz_places WHERE last_visit_date >= :cutoff AND foreign_count = 0 AND id NOT IN (SELECT place_id FROM moz_historyvisits) LIMIT :limit)"),
+    ("moz_inputhistory", "DELETE FROM moz_inputhistory WHERE rowid IN (SELECT rowid FROM moz_inputhistory WHERE place_id NOT IN (SELECT id FROM moz_places) LIMIT :limit)"),
+    ("moz_origins", "DELETE FROM moz_origins WHERE id IN (SELECT id FROM moz_origins WHERE id NOT IN (SELECT origin_id FROM moz_places) LIMIT :limit)"),
+)
+
+FIREFOX_PLACES_FIXUPS = (
+    ("moz_places", "UPDATE moz_places SET visit_count = (SELECT COUNT(*) FROM moz_historyvisits WHERE place_id = moz_places.id), last_visit_date = (SELECT MAX(visit_date) FROM moz_historyvisits WHERE place_id = moz_places.id) WHERE last_visit_date >= :cutoff"),
+)
+
+FIREFOX_COOKIES = (
+    ("moz_cookies", "DELETE FROM moz_cookies WHERE id IN (SELECT id FROM moz_cookies WHERE creationTime >= :cutoff LIMIT :limit)"),
+)
+
+DATABASES = {
+    "History": (webkitTime, CHROMIUM_HISTORY, CHROMIUM_HISTORY_FIXUPS),
+    "Cookies": (webkitTime, CHROMIUM_COOKIES, ()),
+    "places.sqlite": (prTime, FIREFOX_PLACES, FIREFOX_PLACES_FIXUPS),
+    "cookies.sqlite": (prTime, FIREFOX_COOKIES, ()),
+}
+
+
+def classifyDatabase(name):
+    return name if name in DATABASES else None
+
+
+def getCutoff(range_key, now=None):
+    seconds = PURGE_RANGES[range_key]
+    if seconds is None:
+        return None
+    return (time.time() if now is None else now) - seconds
+
+
+def _tables(connection):
+    return set(row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'"))
+
+
+def _deleteInBatches(connection, statement, params, progress):
+    deleted = 0
+    while not progress.cancelled:
+        cursor = connection.execute(statement, params)
+        connection.commit()
+        deleted += cursor.rowcount
+        if cursor.rowcount < params["limit"]:
+            break
+    return deleted
+
+
+def compact(connection):
+    if connection.execute("PRAGMA auto_vacuum").fetchone()[0] == INCREMENTAL_VACUUM:
+        connection.execute("PRAGMA incremental_vacuum").fetchall()
+        connection.commit()
+        return
+    page_count = connection.execute("PRAGMA page_count").fetchone()[0]
+    free_count = connection.execute("PRAGMA freelist_count").fetchone()[0]
+    if page_count and free_count >= page_count * VACUUM_FREE_RATIO:
+        connection.execute("VACUUM")
+
+
+def purgeDatabase(database_path, name, cutoff_seconds, progress, batchSize=BATCH_SIZE):
+    toDbTime, deletes, fixups = DATABASES[name]
+    params = {
+        "cutoff": toDbTime(cutoff_seconds) if cutoff_seconds is not None else 0,
+        "limit": batchSize,
+    }
+    connection = sqlite3.connect(database_path, timeout=5)
+    try:
+        tables = _tables(connection)
+        deleted = 0
+        for table, statement in deletes:
+            if table not in tables:
+                continue
+            try:
+                deleted += _deleteInBatches(connection, statement, params, progress)
+            except sqlite3.OperationalError as e:
+                connection.rollback()
+                logging.error("Skipping purge of {} in {}: {}".format(table, database_path, str(e)))
+        if progress.cancelled:
+            return deleted
+        for table, statement in fixups:
+            if table not in tables:
+                continue
+            try:
+                connection.execute(statement, params)
+                connection.commit()
+            except sqlite3.OperationalError as e:
+                connection.rollback()
+                logging.error("Skipping update of {} in {}: {}".format(table, database_path, str(e)))
+        compact(connection)
+        connection.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+        return deleted
+    finally:
+        connection.close()
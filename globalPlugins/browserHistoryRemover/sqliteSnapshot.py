@@ -0,0 +1,46 @@
+import os
+import sqlite3
+from urllib.request import pathname2url
+
+SQLITE_HEADER = b"SQLite format 3\x00"
+SIDECAR_SUFFIXES = ("-wal", "-shm", "-journal")
+PAGES_PER_STEP = 1024
+
+
+def isSqliteDatabase(path):
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(SQLITE_HEADER)) == SQLITE_HEADER
+    except OSError:
+        return False
+
+
+def isDatabaseSidecar(path):
+    for suffix in SIDECAR_SUFFIXES:
+        if path.endswith(suffix) and isSqliteDatabase(path[:-len(suffix)]):
+            return True
+    return False
+
+
+def databaseSignature(path, stat):
+    signature = [stat.st_size, stat.st_mtime_ns]
+    try:
+        wal_stat = os.stat(path + "-wal")
+        signature += [wal_stat.st_size, wal_stat.st_mtime_ns]
+    except OSError:
+        pass
+    return signature
+
+
+def snapshotDatabase(src_path, dest_path, pagesPerStep=PAGES_PER_STEP):
+    uri = "file:{}?mode=ro".format(pathname2url(os.path.abspath(src_path)))
+    source = sqlite3.connect(uri, uri=True, timeout=5)
+    try:
+        dest = sqlite3.connect(dest_path)
+        try:
+            source.backup(dest, pages=pagesPerStep)
+            dest.execute("PRAGMA journal_mode=DELETE").fetchall()
+        finally:
+            dest.close()
+    finally:
+        source.close()
@@ -0,0 +1,146 @@
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+import psutil
+from .browsers import BROWSERS, BROWSER_PROCESSES, getBrowserPath
+from .deletionEngine import DeletionEngine
+from .shredder import Shredder
+from .planner import buildPlan
+from .progress import JobProgress
+from .sqlitePurge import classifyDatabase, getCutoff, purgeDatabase
+from .targetRules import SHRED_CATEGORIES
+
+DEFAULT_SWEEP_WORKERS = 4
+SKIPPED_HOMES = {"all users", "default", "default user", "defaultapppool", "public"}
+UNKNOWN_OWNER = "*"
+
+
+def getDefaultUsersRoot():
+    return os.path.join(os.environ.get("SystemDrive", "C:") + os.sep, "Users")
+
+
+def findHomes(users_root):
+    homes = []
+    with os.scandir(users_root) as scanner:
+        for entry in scanner:
+            if entry.name.lower() in SKIPPED_HOMES or entry.name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                homes.append(entry.path)
+    return sorted(homes)
+
+
+def getOwnerName(username):
+    return username.rpartition("\\")[2].lower()
+
+
+def getRunningBrowsers(browsers):
+    browsersByProcess = {}
+    for browser in browsers:
+        for name in BROWSER_PROCESSES.get(browser, ()):
+            browsersByProcess[name] = browser
+    running = {}
+    try:
+        for proc in psutil.process_iter(['name', 'username']):
+            try:
+                proc_name = proc.info.get('name')
+                username = proc.info.get('username')
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+            browser = browsersByProcess.get(proc_name.lower()) if proc_name else None
+            if browser:
+                owner = getOwnerName(username) if username else UNKNOWN_OWNER
+                running.setdefault(owner, set()).add(browser)
+    except Exception:
+        pass
+    return running
+
+
+def sweepBrowser(browser_path, browser, range_key, dryRun, shred=False):
+    progress = JobProgress()
+    plan = buildPlan(browser_path, browser, progress)
+    result = {"status": "planned" if dryRun else "cleared"}
+
+    if range_key == "files":
+        result["files"] = plan.files
+        result["bytes"] = plan.bytes
+        if not dryRun:
+            targets = plan.targets
+            if shred:
+                sensitive = [target for target in targets if target[1] in SHRED_CATEGORIES]
+                targets = [target for target in targets if target[1] not in SHRED_CATEGORIES]
+                shredded_files, unshredded_files, shredded_dirs, shredded_bytes = Shredder(
+                    workers=1, onError=progress.metrics.addError
+                ).shredTargets(sensitive)
+                result["notShredded"] = unshredded_files
+            DeletionEngine(workers=1, onError=progress.metrics.addError).removeTargets(targets)
+    else:
+        cutoff = getCutoff(range_key)
+        databases = [entry for entry, category in plan.targets if classifyDatabase(entry.name)]
+        result["databases"] = len(databases)
+        result["bytes"] = 0
+        result["rows"] = 0
+        for entry in databases:
+            if dryRun:
+                continue
+            try:
+                size = os.path.getsize(entry.path)
+                result["rows"] += purgeDatabase(entry.path, classifyDatabase(entry.name), cutoff, progress)
+                result["bytes"] += max(0, size - os.path.getsize(entry.path))
+            except Exception as e:
+                logging.error("Error purging {}: {}".format(entry.path, str(e)))
+                progress.metrics.addError(e)
+
+    result["errors"] = dict(progress.metrics.errors)
+    return result
+
+
+def sweepHome(home, browsers, running, range_key, dryRun, force, shred=False):
+    results = {}
+    owner = os.path.basename(os.path.normpath(home)).lower()
+    running_here = running.get(owner, set()) | running.get(UNKNOWN_OWNER, set())
+    for browser in browsers:
+        browser_path = getBrowserPath(browser, home)
+        if not browser_path or not os.path.isdir(browser_path):
+            continue
+        if browser in running_here and not force:
+            results[browser] = {"status": "skipped", "reason": "running"}
+            continue
+        try:
+            results[browser] = sweepBrowser(browser_path, browser, range_key, dryRun, shred)
+        except Exception as e:
+            logging.error("Error clearing {} for {}: {}".format(browser, home, str(e)))
+            results[browser] = {"status": "failed", "reason": str(e)}
+    return results
+
+
+def sweep(homes, browsers=BROWSERS, range_key="files", workers=DEFAULT_SWEEP_WORKERS, dryRun=False, force=False, shred=False):
+    start = time.perf_counter()
+    running = getRunningBrowsers(browsers)
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="browserHistoryRemoverSweep") as executor:
+        results = list(executor.map(
+            lambda home: sweepHome(home, browsers, running, range_key, dryRun, force, shred),
+            homes
+        ))
+
+    totals = {"files": 0, "bytes": 0, "rows": 0, "errors": 0, "skipped": 0, "failed": 0}
+    users = {}
+    for home, browser_results in zip(homes, results):
+        users[os.path.basename(os.path.normpath(home))] = browser_results
+        for result in browser_results.values():
+            if result["status"] in ("skipped", "failed"):
+                totals[result["status"]] += 1
+                continue
+            for key in ("files", "bytes", "rows"):
+                totals[key] += result.get(key, 0)
+            totals["errors"] += sum(result["errors"].values())
+
+    return {
+        "range": range_key,
+        "dryRun": dryRun,
+        "running": dict((owner, sorted(names)) for owner, names in sorted(running.items())),
+        "seconds": round(time.perf_counter() - start, 3),
+        "users": users,
+        "totals": totals,
+    }
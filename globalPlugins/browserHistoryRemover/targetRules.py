@@ -0,0 +1,143 @@
+import fnmatch
+import os
+
+SQLITE_SIDECARS = ("-journal", "-wal", "-shm")
+BACKUP_EXCLUDED_CATEGORIES = frozenset(["cache"])
+SHRED_CATEGORIES = frozenset(["history", "formData", "cookies", "logins"])
+
+CHROMIUM_RULES = {
+    "history": {
+        "files": ("History", "Visited Links", "Top Sites", "Shortcuts", "Network Action Predictor", "History Provider Cache"),
+    },
+    "formData": {
+        "files": ("Web Data",),
+    },
+    "cookies": {
+        "files": ("Cookies", "Network/Cookies", "Extension Cookies"),
+    },
+    "favicons": {
+        "files": ("Favicons",),
+    },
+    "session": {
+        "files": ("Current Session", "Current Tabs", "Last Session", "Last Tabs"),
+        "dirs": ("Sessions",),
+    },
+    "cache": {
+        "dirs": ("Cache", "Code Cache", "GPUCache", "DawnCache", "DawnGraphiteCache", "DawnWebGPUCache", "Media Cache",
+                 "Service Worker/CacheStorage", "Service Worker/ScriptCache"),
+    },
+    "storage": {
+        "dirs": ("Local Storage", "Session Storage", "IndexedDB", "databases", "File System", "Service Worker/Database", "WebStorage"),
+    },
+    "sync": {
+        "dirs": ("Sync Data",),
+    },
+}
+
+GECKO_RULES = {
+    "history": {
+        "files": ("places.sqlite",),
+    },
+    "formData": {
+        "files": ("formhistory.sqlite",),
+    },
+    "downloads": {
+        "files": ("downloads.sqlite", "downloads.json"),
+    },
+    "cookies": {
+        "files": ("cookies.sqlite",),
+    },
+    "logins": {
+        "files": ("logins.json", "logins-backup.json"),
+    },
+    "favicons": {
+        "files": ("favicons.sqlite",),
+    },
+    "session": {
+        "files": ("sessionCheckpoints.json",),
+        "dirs": ("sessionstore-backups",),
+        "globs": ("sessionstore.*",),
+    },
+    "cache": {
+        "dirs": ("cache2", "startupCache", "thumbnails", "jumpListCache", "OfflineCache", "Cache"),
+    },
+    "storage": {
+        "files": ("webappsstore.sqlite",),
+        "dirs": ("storage",),
+    },
+}
+
+BROWSER_RULES = {
+    "Google Chrome": CHROMIUM_RULES,
+    "Microsoft Edge": CHROMIUM_RULES,
+    "Opera": CHROMIUM_RULES,
+    "Brave": CHROMIUM_RULES,
+    "Vivaldi": CHROMIUM_RULES,
+    "Chromium": CHROMIUM_RULES,
+    "Firefox": GECKO_RULES,
+    "Waterfox": GECKO_RULES,
+    "Pale Moon": GECKO_RULES,
+    "Basilisk": GECKO_RULES,
+    "SeaMonkey": GECKO_RULES,
+}
+
+
+class TargetRules:
+    def __init__(self, rules):
+        self._lookups = {}
+        for category, kinds in rules.items():
+            for kind, patterns in kinds.items():
+                for pattern in patterns:
+                    parent, sep, name = pattern.rpartition("/")
+                    names, globs = self._lookups.setdefault(parent, ({}, []))
+                    if kind == "globs":
+                        globs.append((name.lower(), category))
+                    elif kind == "dirs":
+                        names[name.lower()] = (category, True)
+                    else:
+                        names[name.lower()] = (category, False)
+                        for suffix in SQLITE_SIDECARS:
+                            names[(name + suffix).lower()] = (category, False)
+
+    def _match(self, entry, names, globs):
+        name = entry.name.lower()
+        match = names.get(name)
+        if match:
+            category, wantDir = match
+            if entry.is_dir(follow_symlinks=False) == wantDir:
+                return category
+            return None
+        for pattern, category in globs:
+            if fnmatch.fnmatchcase(name, pattern):
+                return category
+        return None
+
+    def scan(self, profile_path, excluded=frozenset()):
+        for parent, (names, globs) in self._lookups.items():
+            dir_path = os.path.join(profile_path, *parent.split("/")) if parent else profile_path
+            try:
+                scanner = os.scandir(dir_path)
+            except OSError:
+                continue
+            with scanner:
+                for entry in scanner:
+                    try:
+                        category = self._match(entry, names, globs)
+                    except OSError:
+                        continue
+                    if category and category not in excluded:
+                        yield entry, category
+
+    def scanPaths(self, profile_paths, excluded=frozenset()):
+        for profile_path in profile_paths:
+            for target in self.scan(profile_path, excluded):
+                yield target
+
+
+_compiled = {}
+
+
+def getTargetRules(browser):
+    if browser not in _compiled:
+        _compiled[browser] = TargetRules(BROWSER_RULES.get(browser, CHROMIUM_RULES))
+    return _compiled[browser]
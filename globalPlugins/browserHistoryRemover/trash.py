@@ -0,0 +1,106 @@
+import os
+import shutil
+import logging
+import queue
+import tempfile
+import threading
+from .journal import findReferencedPaths
+
+TRASH_PREFIX = ".browserHistoryRemover-trash-"
+ROLLBACK_PREFIX = ".browserHistoryRemover-rollback-"
+
+
+def getTrashParent(data_path):
+    return os.path.dirname(os.path.normpath(data_path))
+
+
+def createTrashDir(data_path):
+    return tempfile.mkdtemp(prefix=TRASH_PREFIX, dir=getTrashParent(data_path))
+
+
+def moveToTrash(targets, trash_path):
+    moved_files = 0
+    moved_dirs = 0
+    leftovers = []
+
+    for index, (entry, category) in enumerate(targets):
+        try:
+            isDir = entry.is_dir(follow_symlinks=False)
+            os.rename(entry.path, os.path.join(trash_path, str(index)))
+        except OSError:
+            leftovers.append((entry, category))
+            continue
+        if isDir:
+            moved_dirs += 1
+        else:
+            moved_files += 1
+
+    return moved_files, moved_dirs, leftovers
+
+
+def findLeftoverTrash(data_paths, keep=frozenset()):
+    found = []
+    for parent in set(getTrashParent(path) for path in data_paths if path):
+        try:
+            with os.scandir(parent) as scanner:
+                for entry in scanner:
+                    if not entry.name.startswith((TRASH_PREFIX, ROLLBACK_PREFIX)):
+                        continue
+                    if os.path.normcase(os.path.normpath(entry.path)) in keep:
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        found.append(entry.path)
+        except OSError:
+            continue
+    return found
+
+
+class TrashReaper:
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _ensureThread(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="browserHistoryRemoverTrashReaper",
+                    daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            try:
+                job()
+            except Exception as e:
+                logging.error("Error emptying trash: {}".format(str(e)))
+
+    def run(self, job):
+        self._queue.put(job)
+        self._ensureThread()
+
+    def reap(self, trash_path):
+        self.run(lambda: shutil.rmtree(trash_path, ignore_errors=True))
+
+    def collectLeftovers(self, data_paths, journal_dir=None):
+        def collect():
+            keep = findReferencedPaths(journal_dir) if journal_dir else frozenset()
+            for trash_path in findLeftoverTrash(data_paths, keep):
+                shutil.rmtree(trash_path, ignore_errors=True)
+
+        self.run(collect)
+
+    def stop(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                self._queue.put(None)
+            self._thread = None
+
+
+reaper = TrashReaper()